@@ -6,9 +6,11 @@ EMWIN servers and receive weather data using the Quick Block Transfer protocol.
 """
 
 import asyncio
+import contextlib
 import logging
 import signal
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -20,21 +22,29 @@ from byteblaster import (
     CompletedFile,
 )
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
 class FileSaver:
     """Example handler for saving completed files with async processing."""
 
-    def __init__(self, output_dir: str = "weather_data") -> None:
+    def __init__(self, output_dir: str = "weather_data", max_concurrent_writes: int = 8) -> None:
         """Initialize handler with output directory.
 
         Args:
             output_dir: Directory to save received files
+            max_concurrent_writes: Maximum number of writes running in worker threads
 
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._ensured_dirs: set[Path] = {self.output_dir}
+        self._write_slots = asyncio.Semaphore(max_concurrent_writes)
         self.completed_files_count = 0
         self.total_bytes_received = 0
 
@@ -42,18 +52,21 @@ class FileSaver:
         """Handle a completed file with async I/O."""
         output_path = self.output_dir / file.filename
 
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Simulate async file processing (could be database writes, API calls, etc.)
-        await asyncio.sleep(0.01)  # Simulate small processing delay
+        # Ensure parent directory exists, creating each directory only once
+        parent_dir = output_path.parent
+        if parent_dir not in self._ensured_dirs:
+            parent_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent_dir)
 
-        # Write file
+        # Write file off the event loop so segment processing is not stalled, bounding
+        # the number of writes so a slow disk cannot exhaust the default thread pool
         try:
-            output_path.write_bytes(file.data)
+            async with self._write_slots:
+                await asyncio.to_thread(output_path.write_bytes, file.data)
             self.completed_files_count += 1
             self.total_bytes_received += len(file.data)
-            logger.info("✓ Saved complete file: %s (%d bytes)", output_path, len(file.data))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Saved complete file: %s (%d bytes)", output_path, len(file.data))
             if self.completed_files_count % 10 == 0:
                 logger.info(
                     "Total files saved: %d, Total bytes: %.2f KB",
@@ -73,9 +86,6 @@ class FileValidator:
 
     async def validate_file(self, file: CompletedFile) -> None:
         """Validate file content asynchronously."""
-        # Simulate async validation (checksum verification, format validation, etc.)
-        await asyncio.sleep(0.005)  # Simulate validation processing
-
         try:
             # Example validation: check if file is not empty and has reasonable size
             if len(file.data) == 0:
@@ -102,18 +112,19 @@ class FileStats:
 
     def __init__(self) -> None:
         """Initialize stats collector."""
-        self.file_types: dict[str, int] = {}
+        self.file_types: Counter[str] = Counter()
         self.total_files = 0
 
     async def collect_stats(self, file: CompletedFile) -> None:
         """Collect file statistics asynchronously."""
-        # Simulate async stats processing
-        await asyncio.sleep(0.002)
-
         try:
-            # Extract file extension
-            file_ext = Path(file.filename).suffix.lower() or "no_ext"
-            self.file_types[file_ext] = self.file_types.get(file_ext, 0) + 1
+            # Extract file extension without building a Path object per file; like
+            # Path.suffix, only the final path component is considered
+            name = file.filename
+            name = name[name.rfind("/") + 1 :]
+            dot = name.rfind(".")
+            file_ext = name[dot:].lower() if 0 < dot < len(name) - 1 else "no_ext"
+            self.file_types[file_ext] += 1
             self.total_files += 1
 
             # Print stats every 50 files
@@ -124,6 +135,29 @@ class FileStats:
             logger.exception("✗ Stats collection error for %s", file.filename)
 
 
+class FusedFileHandler:
+    """Example handler that validates, counts and saves each file in one subscriber."""
+
+    def __init__(self, saver: FileSaver, validator: FileValidator, stats: FileStats) -> None:
+        """Initialize fused handler with the individual handlers it drives.
+
+        Args:
+            saver: Handler that writes files to disk
+            validator: Handler that validates file content
+            stats: Handler that collects file statistics
+
+        """
+        self.saver = saver
+        self.validator = validator
+        self.stats = stats
+
+    async def handle_file(self, file: CompletedFile) -> None:
+        """Run validation, stats and saving in sequence without per-handler tasks."""
+        await self.validator.validate_file(file)
+        await self.stats.collect_stats(file)
+        await self.saver.save_file(file)
+
+
 async def main() -> None:
     """Run the ByteBlaster example client."""
     # Setup logging
@@ -140,16 +174,17 @@ async def main() -> None:
     logger.info("Email: %s", email)
     logger.info("Press Ctrl+C to stop")
 
-    # Create multiple concurrent file handlers to demonstrate TaskGroup benefits
+    # Create file handlers and fuse them into a single subscriber
     file_saver = FileSaver("weather_data")
     file_validator = FileValidator()
     file_stats = FileStats()
+    fused_handler = FusedFileHandler(file_saver, file_validator, file_stats)
 
     logger.info("Handlers configured:")
-    logger.info("  - File Saver: Saves files to disk")
     logger.info("  - File Validator: Validates file content")
     logger.info("  - File Stats: Collects file statistics")
-    logger.info("All handlers will process files concurrently using asyncio.TaskGroup")
+    logger.info("  - File Saver: Saves files to disk")
+    logger.info("All handlers run in sequence from one fused subscriber")
 
     # Create client options
     options = ByteBlasterClientOptions(
@@ -160,12 +195,10 @@ async def main() -> None:
         connection_timeout=10.0,  # 10 second connection timeout
     )
 
-    # Create file manager and subscribe multiple handlers
-    # These will all execute concurrently using asyncio.TaskGroup
+    # Create file manager and subscribe the fused handler
+    # Subscribing each handler separately would run them concurrently as tasks
     file_manager = ByteBlasterFileManager(options=options)
-    file_manager.subscribe(file_saver.save_file)
-    file_manager.subscribe(file_validator.validate_file)
-    file_manager.subscribe(file_stats.collect_stats)
+    file_manager.subscribe(fused_handler.handle_file)
 
     logger.info("Note: This example uses the callback-based approach.")
     logger.info("For async iterator examples, see example_async_iterators.py")
@@ -177,9 +210,12 @@ async def main() -> None:
         logger.info("Shutdown signal received...")
         shutdown_event.set()
 
-    # Register signal handlers
+    # Register signal handlers on the event loop; Windows lacks support and falls
+    # back to KeyboardInterrupt for Ctrl+C
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, lambda _s, _f: signal_handler())
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, signal_handler)
 
     try:
         # Start the file manager
@@ -215,7 +251,7 @@ async def main() -> None:
 def run_example() -> None:
     """Run the example using asyncio."""
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("Exiting...")
     except Exception as e:  # noqa: BLE001
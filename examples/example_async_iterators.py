@@ -7,9 +7,13 @@ with structured concurrency.
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
+import re
 import signal
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -18,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 import builtins
 
 from byteblaster import (
+    FILLFILE_NAME,
     ByteBlasterClient,
     ByteBlasterClientOptions,
     ByteBlasterFileManager,
@@ -25,16 +30,40 @@ from byteblaster import (
     QBTSegment,
 )
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Filename keywords that mark a segment as high priority
+PRIORITY_PATTERN = re.compile("ALERT|WARNING|URGENT", re.IGNORECASE)
+
+# Lowercase filename suffixes treated as text products
+TEXT_SUFFIXES = frozenset({".txt"})
+
+
+@functools.lru_cache(maxsize=1024)
+def is_priority_filename(filename: str) -> bool:
+    """Return True if the filename contains a priority keyword.
+
+    Cached because every segment of a file carries the same filename.
+    """
+    return PRIORITY_PATTERN.search(filename) is not None
+
 
 class AsyncFileProcessor:
     """Example async file processor using modern patterns."""
 
-    def __init__(self, output_dir: str = "async_weather_data") -> None:
-        """Initialize processor with output directory."""
+    def __init__(
+        self, output_dir: str = "async_weather_data", activity: asyncio.Event | None = None
+    ) -> None:
+        """Initialize processor with output directory and optional activity event."""
+        self._activity = activity or asyncio.Event()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._ensured_dirs: set[Path] = {self.output_dir}
         self.processed_count = 0
         self.total_bytes = 0
 
@@ -49,16 +78,18 @@ class AsyncFileProcessor:
     async def _process_single_file(self, file: CompletedFile) -> None:
         """Process a single completed file with async I/O."""
         output_path = self.output_dir / file.filename
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists, creating each directory only once
+        parent_dir = output_path.parent
+        if parent_dir not in self._ensured_dirs:
+            parent_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent_dir)
 
         try:
-            # Simulate async processing (validation, transformation, etc.)
-            await asyncio.sleep(0.01)
-
-            # Write file asynchronously
-            output_path.write_bytes(file.data)
+            # Write file off the event loop so segment ingest is not stalled
+            await asyncio.to_thread(output_path.write_bytes, file.data)
 
             self.processed_count += 1
+            self._activity.set()
             self.total_bytes += len(file.data)
 
             if self.processed_count % 10 == 0:
@@ -75,49 +106,41 @@ class AsyncFileProcessor:
 class SegmentAnalyzer:
     """Example segment analyzer using async iterator pattern."""
 
-    def __init__(self) -> None:
-        """Initialize analyzer."""
+    def __init__(self, activity: asyncio.Event | None = None) -> None:
+        """Initialize analyzer with optional activity event."""
+        self._activity = activity or asyncio.Event()
         self.segment_count = 0
-        self.file_types: dict[str, int] = {}
+        self.file_types: Counter[str] = Counter()
         self.large_files: list[str] = []
+        # Segments of one file share a filename, so parse each suffix only once
+        self._suffix_cache: dict[str, str] = {}
 
     async def analyze_segments(self, client: ByteBlasterClient) -> None:
         """Analyze segments using async iterator with filtering and batching."""
         logger.info("🔍 Starting async iterator segment analysis...")
 
         async with client.stream_segments(max_queue_size=200) as segments:
-            batch: list[QBTSegment] = []
-            async for segment in segments:
+            # Process in batches for efficiency, one await per batch
+            async for batch in segments.batches(max_batch_size=20):
                 # Filter out filler data
-                if segment.filename == "FILLFILE.TXT":
-                    continue
-
-                batch.append(segment)
-                self.segment_count += 1
-
-                # Process in batches for efficiency
-                if len(batch) >= 20:
-                    await self._analyze_batch(batch)
-                    batch.clear()
-
-            # Process remaining segments
-            if batch:
-                await self._analyze_batch(batch)
+                self._analyze_batch([s for s in batch if s.filename != FILLFILE_NAME])
 
-    async def _analyze_batch(self, segments: list[QBTSegment]) -> None:
-        """Analyze a batch of segments concurrently."""
-        async with asyncio.TaskGroup() as tg:
-            for segment in segments:
-                tg.create_task(self._analyze_segment(segment))
+    def _analyze_batch(self, segments: list[QBTSegment]) -> None:
+        """Analyze a batch of segments inline; the per-segment work is CPU-only."""
+        for segment in segments:
+            self._analyze_segment(segment)
 
-    async def _analyze_segment(self, segment: QBTSegment) -> None:
+    def _analyze_segment(self, segment: QBTSegment) -> None:
         """Analyze individual segment."""
-        # Simulate async analysis
-        await asyncio.sleep(0.001)
+        self.segment_count += 1
+        self._activity.set()
 
         # Track file types
-        file_ext = Path(segment.filename).suffix.lower() or "no_ext"
-        self.file_types[file_ext] = self.file_types.get(file_ext, 0) + 1
+        file_ext = self._suffix_cache.get(segment.filename)
+        if file_ext is None:
+            file_ext = Path(segment.filename).suffix.lower() or "no_ext"
+            self._suffix_cache[segment.filename] = file_ext
+        self.file_types[file_ext] += 1
 
         # Track large files (estimate from first segment)
         if segment.block_number == 1:
@@ -136,8 +159,11 @@ class ConcurrentPatternDemo:
         """Compare callback vs iterator patterns running concurrently."""
         logger.info("🚀 Running concurrent callback vs iterator demo...")
 
+        # Set by every processor whenever a counter changes
+        activity = asyncio.Event()
+
         # Callback-based handlers
-        callback_saver = CallbackFileSaver("callback_files")
+        callback_saver = CallbackFileSaver("callback_files", activity=activity)
         callback_validator = CallbackFileValidator()
 
         # Subscribe callback handlers
@@ -145,29 +171,40 @@ class ConcurrentPatternDemo:
         file_manager.subscribe(callback_validator.validate_file)
 
         # Async iterator processor
-        iterator_processor = AsyncFileProcessor("iterator_files")
+        iterator_processor = AsyncFileProcessor("iterator_files", activity=activity)
 
         # Run both patterns concurrently
         async with asyncio.TaskGroup() as tg:
             # Iterator-based processing
             tg.create_task(iterator_processor.process_file_stream(file_manager))
 
+            # Background writer draining files queued by the callback saver
+            tg.create_task(callback_saver.run_writer())
+
             # Segment analysis using iterators
-            analyzer = SegmentAnalyzer()
+            analyzer = SegmentAnalyzer(activity=activity)
             tg.create_task(analyzer.analyze_segments(file_manager.client))
 
             # Monitor and report stats
-            tg.create_task(self._monitor_progress(callback_saver, iterator_processor, analyzer))
+            tg.create_task(
+                self._monitor_progress(activity, callback_saver, iterator_processor, analyzer)
+            )
 
     async def _monitor_progress(
         self,
+        activity: asyncio.Event,
         callback_saver: "CallbackFileSaver",
         iterator_processor: "AsyncFileProcessor",
         analyzer: "SegmentAnalyzer",
     ) -> None:
-        """Monitor and report progress from both patterns."""
+        """Monitor and report progress from both patterns.
+
+        Reports only after something has changed, and at most every 10 seconds,
+        so an idle feed does not keep waking the event loop.
+        """
         while True:
-            await asyncio.sleep(10)  # Report every 10 seconds
+            await activity.wait()
+            activity.clear()
             logger.info("\n📊 Progress Report:")
             logger.info("  Callback files saved: %d", callback_saver.saved_count)
             logger.info("  Iterator files processed: %d", iterator_processor.processed_count)
@@ -175,25 +212,53 @@ class ConcurrentPatternDemo:
             if analyzer.file_types:
                 msg = f"  File types seen: {dict(list(analyzer.file_types.items())[:5])}"
                 logger.info(msg)
+            await asyncio.sleep(10)  # Report at most every 10 seconds
 
 
 class CallbackFileSaver:
-    """Traditional callback-based file saver for comparison."""
+    """Traditional callback-based file saver for comparison.
+
+    The callback only queues the file; a background writer started with
+    run_writer() does the disk I/O so dispatch never waits on the disk.
+    """
 
-    def __init__(self, output_dir: str) -> None:
-        """Initialize callback saver."""
+    def __init__(
+        self, output_dir: str, max_queue_size: int = 256, activity: asyncio.Event | None = None
+    ) -> None:
+        """Initialize callback saver with optional activity event."""
+        self._activity = activity or asyncio.Event()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._ensured_dirs: set[Path] = {self.output_dir}
         self.saved_count = 0
+        self._queue: asyncio.Queue[CompletedFile] = asyncio.Queue(maxsize=max_queue_size)
 
     async def save_file(self, file: CompletedFile) -> None:
-        """Save file using callback pattern."""
+        """Queue file for the background writer using callback pattern."""
+        await self._queue.put(file)
+
+    async def run_writer(self) -> None:
+        """Write queued files to disk until cancelled."""
+        while True:
+            file = await self._queue.get()
+            try:
+                await self._write_file(file)
+            finally:
+                self._queue.task_done()
+
+    async def _write_file(self, file: CompletedFile) -> None:
+        """Write a single file to the output directory."""
         output_path = self.output_dir / file.filename
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists, creating each directory only once
+        parent_dir = output_path.parent
+        if parent_dir not in self._ensured_dirs:
+            parent_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent_dir)
 
         try:
-            output_path.write_bytes(file.data)
+            await asyncio.to_thread(output_path.write_bytes, file.data)
             self.saved_count += 1
+            self._activity.set()
         except Exception:
             logger.exception("Callback saver error")
 
@@ -207,8 +272,6 @@ class CallbackFileValidator:
 
     async def validate_file(self, file: CompletedFile) -> None:
         """Validate file using callback pattern."""
-        await asyncio.sleep(0.005)  # Simulate validation
-
         # Simple validation
         if len(file.data) > 0:
             self.validated_count += 1
@@ -237,7 +300,9 @@ async def filter_and_transform_segments(client: ByteBlasterClient) -> None:
         # Create a filtered stream of only text files
         text_segments: list[QBTSegment] = []
         async for segment in segments:
-            if segment.filename.endswith((".txt", ".TXT")):
+            filename = segment.filename
+            dot = filename.rfind(".")
+            if dot >= 0 and filename[dot:].lower() in TEXT_SUFFIXES:
                 text_segments.append(segment)
 
                 # Process when we have 5 text segments
@@ -251,15 +316,9 @@ async def batch_process_segments(client: ByteBlasterClient) -> None:
     logger.info("⏱️  Pattern 2: Batch processing with timeout...")
 
     async with client.stream_segments() as segments:
-        batch: list[QBTSegment] = []
-
-        async for segment in segments:
-            batch.append(segment)
-
-            # Process batch when full or after timeout
-            if len(batch) >= 10:
-                await process_batch_with_timeout(batch)
-                batch.clear()
+        # Each batch holds up to 10 of the segments queued so far
+        async for batch in segments.batches(max_batch_size=10):
+            await process_batch_with_timeout(batch)
 
 
 async def concurrent_stream_processing(client: ByteBlasterClient) -> None:
@@ -279,11 +338,8 @@ async def process_priority_segments(client: ByteBlasterClient) -> None:
     """Process high-priority segments."""
     async with client.stream_segments(max_queue_size=50) as segments:
         async for segment in segments:
-            if any(
-                keyword in segment.filename.upper() for keyword in ["ALERT", "WARNING", "URGENT"]
-            ):
+            if is_priority_filename(segment.filename):
                 logger.info("🚨 Priority: %s", segment.filename)
-                await asyncio.sleep(0.001)  # Quick processing
 
 
 async def process_regular_segments(client: ByteBlasterClient) -> None:
@@ -291,9 +347,7 @@ async def process_regular_segments(client: ByteBlasterClient) -> None:
     count = 0
     async with client.stream_segments(max_queue_size=100) as segments:
         async for segment in segments:
-            if not any(
-                keyword in segment.filename.upper() for keyword in ["ALERT", "WARNING", "URGENT"]
-            ):
+            if not is_priority_filename(segment.filename):
                 count += 1
                 if count % 50 == 0:
                     logger.info("📄 Processed %d regular segments", count)
@@ -302,7 +356,6 @@ async def process_regular_segments(client: ByteBlasterClient) -> None:
 async def process_text_batch(segments: list[QBTSegment]) -> None:
     """Process a batch of text segments."""
     logger.info("📝 Processing %d text segments...", len(segments))
-    await asyncio.sleep(0.01)
 
 
 async def process_batch_with_timeout(batch: list[QBTSegment]) -> None:
@@ -349,8 +402,12 @@ async def main() -> None:
         logger.info("🛑 Shutdown signal received...")
         shutdown_event.set()
 
+    # Signal handlers run on the event loop; Windows lacks support and falls back
+    # to KeyboardInterrupt for Ctrl+C
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, lambda _s, _f: signal_handler())
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, signal_handler)
 
     try:
         # Start the file manager
@@ -384,7 +441,7 @@ async def main() -> None:
 def run_example() -> None:
     """Run the example using asyncio."""
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("👋 Exiting...")
     except Exception as e:  # noqa: BLE001
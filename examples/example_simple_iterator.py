@@ -6,21 +6,29 @@ data streams using modern Python 3.12+ structured concurrency patterns.
 """
 
 import asyncio
+import contextlib
 import logging
 import signal
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from byteblaster import (
+    FILLFILE_NAME,
     ByteBlasterClient,
     ByteBlasterClientOptions,
     ByteBlasterFileManager,
     CompletedFile,
 )
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +36,7 @@ async def process_files_with_iterator(file_manager: ByteBlasterFileManager) -> N
     """Process files using async iterator pattern."""
     output_dir = Path("iterator_weather_data")
     output_dir.mkdir(exist_ok=True)
+    ensured_dirs: set[Path] = {output_dir}
 
     logger.info("🔄 Starting file processing with async iterator...")
 
@@ -35,7 +44,7 @@ async def process_files_with_iterator(file_manager: ByteBlasterFileManager) -> N
     async with file_manager.stream_files(max_queue_size=50) as files:
         async for completed_file in files:
             # Process each file as it arrives
-            await save_file(completed_file, output_dir)
+            await save_file(completed_file, output_dir, ensured_dirs)
 
 
 async def process_segments_with_iterator(client: ByteBlasterClient) -> None:
@@ -43,20 +52,25 @@ async def process_segments_with_iterator(client: ByteBlasterClient) -> None:
     logger.info("🔍 Starting segment analysis with async iterator...")
 
     segment_count = 0
-    file_types: dict[str, int] = {}
+    file_types: Counter[str] = Counter()
+    # Segments of one file share a filename, so parse each suffix only once
+    suffix_cache: dict[str, str] = {}
 
     # Use async iterator to process raw segments
     async with client.stream_segments(max_queue_size=100) as segments:
         async for segment in segments:
             # Skip filler data
-            if segment.filename == "FILLFILE.TXT":
+            if segment.filename == FILLFILE_NAME:
                 continue
 
             segment_count += 1
 
             # Track file types
-            file_ext = Path(segment.filename).suffix.lower() or "no_ext"
-            file_types[file_ext] = file_types.get(file_ext, 0) + 1
+            file_ext = suffix_cache.get(segment.filename)
+            if file_ext is None:
+                file_ext = Path(segment.filename).suffix.lower() or "no_ext"
+                suffix_cache[segment.filename] = file_ext
+            file_types[file_ext] += 1
 
             # Report progress
             if segment_count % 100 == 0:
@@ -64,17 +78,20 @@ async def process_segments_with_iterator(client: ByteBlasterClient) -> None:
                 logger.info("   File types: %s", dict(list(file_types.items())[:3]))
 
 
-async def save_file(file: CompletedFile, output_dir: Path) -> None:
-    """Save a completed file to disk."""
+async def save_file(file: CompletedFile, output_dir: Path, ensured_dirs: set[Path]) -> None:
+    """Save a completed file to disk.
+
+    ensured_dirs holds directories already known to exist, so each is created only once.
+    """
     output_path = output_dir / file.filename
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    parent_dir = output_path.parent
+    if parent_dir not in ensured_dirs:
+        parent_dir.mkdir(parents=True, exist_ok=True)
+        ensured_dirs.add(parent_dir)
 
     try:
-        # Simulate some async processing
-        await asyncio.sleep(0.01)
-
-        # Write file
-        output_path.write_bytes(file.data)
+        # Write file off the event loop
+        await asyncio.to_thread(output_path.write_bytes, file.data)
         logger.info("✅ Saved: %s (%d bytes)", file.filename, len(file.data))
 
     except OSError:
@@ -113,8 +130,12 @@ async def main() -> None:
         logger.info("🛑 Shutdown signal received...")
         shutdown_event.set()
 
+    # Signal handlers run on the event loop; Windows lacks support and falls back
+    # to KeyboardInterrupt for Ctrl+C
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, lambda _s, _f: signal_handler())
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, signal_handler)
 
     try:
         # Start the client
@@ -145,7 +166,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     except Exception as e:
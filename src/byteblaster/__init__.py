@@ -64,6 +64,7 @@ from byteblaster.file_manager import (
     FileStream,
 )
 from byteblaster.protocol.models import (
+    FILLFILE_NAME,
     ByteBlasterServerList,
     QBTSegment,
 )
@@ -74,6 +75,7 @@ __author__ = "ByteBlaster Python Team"
 __email__ = "support@example.com"
 
 __all__ = [
+    "FILLFILE_NAME",
     "ByteBlasterClient",
     "ByteBlasterClientOptions",
     "ByteBlasterFileManager",
@@ -8,6 +8,7 @@ Block Transfer protocol.
 import asyncio
 import contextlib
 import logging
+import time
 import types
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
@@ -89,6 +90,43 @@ class SegmentStream:
                 raise StopAsyncIteration
             return item
 
+    async def batches(self, max_batch_size: int = 32) -> AsyncIterator[list[QBTSegment]]:
+        """Iterate over segments in batches of those already queued.
+
+        Waits for at least one segment, then drains up to max_batch_size queued
+        segments without suspending, so consumers pay one await per batch rather
+        than one per segment. Batches are never padded or delayed to fill up.
+
+        When the stream is closed, a batch that is partly collected when the
+        end-of-stream marker is reached is yielded as is, even if it holds fewer
+        than max_batch_size segments, and iteration then stops.
+
+        Example usage:
+            async with client.stream_segments() as segments:
+                async for batch in segments.batches(max_batch_size=50):
+                    await process_batch(batch)
+
+        Args:
+            max_batch_size: Maximum number of segments per batch (default: 32)
+
+        Yields:
+            Non-empty lists of segments in arrival order
+
+        """
+        queue = self._queue
+        while not self._closed:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < max_batch_size and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    yield batch
+                    return
+                batch.append(item)
+            yield batch
+
     async def _enqueue_segment(self, segment: QBTSegment) -> None:
         """Queue segment for async iteration with backpressure."""
         if self._closed:
@@ -310,6 +348,7 @@ class Watchdog:
         self._max_exceptions = max_exceptions
         self._exception_count = 0
         self._last_data_time = 0.0
+        self._clock: Callable[[], float] = time.monotonic
         self._task: asyncio.Task[None] | None = None
         self._active = False
 
@@ -331,7 +370,8 @@ class Watchdog:
 
         """
         self._active = True
-        self._last_data_time = asyncio.get_event_loop().time()
+        self._clock = asyncio.get_running_loop().time
+        self._last_data_time = self._clock()
         self._exception_count = 0
 
         self._task = asyncio.create_task(self._monitor_loop(close_callback))
@@ -367,7 +407,7 @@ class Watchdog:
         used by the monitoring loop to track data reception intervals and prevent
         false timeout triggers during normal operation.
         """
-        self._last_data_time = asyncio.get_event_loop().time()
+        self._last_data_time = self._clock()
 
     def on_exception(self) -> None:
         """Increment the exception counter when protocol or processing errors occur.
@@ -408,7 +448,7 @@ class Watchdog:
                 if not self._active:
                     break
 
-                current_time = asyncio.get_event_loop().time()
+                current_time = self._clock()
                 time_since_data = current_time - self._last_data_time
 
                 if time_since_data > self._timeout:
@@ -428,7 +468,7 @@ class Watchdog:
             logger.exception("Watchdog monitor error")
 
 
-@dataclass
+@dataclass(slots=True)
 class ByteBlasterClientOptions:
     """Comprehensive configuration options for ByteBlaster client initialization.
 
@@ -504,6 +544,9 @@ class ByteBlasterClient:
         """
         self._email = options.email
         self._reconnect_delay = options.reconnect_delay
+        # Delays derived from reconnect_delay, fixed for the client's lifetime
+        self._backoff_delay = min(self._reconnect_delay * 4, 60.0)  # Cap at 60 seconds
+        self._failover_delay = min(self._reconnect_delay, 2.0)
         self._connection_timeout = options.connection_timeout
 
         # Core components
@@ -517,10 +560,21 @@ class ByteBlasterClient:
         self._running = False
         self._connected = False
         self._reconnect_task: asyncio.Task[None] | None = None
-        self._connection_lost_event = asyncio.Event()
+        # Resolved by on_connection_lost; a fresh future is armed per connection attempt
+        self._connection_lost: asyncio.Future[None] | None = None
+
+        # Decoded segments waiting for the long-lived worker that runs the handlers
+        self._segment_queue: asyncio.Queue[QBTSegment] = asyncio.Queue()
+        self._segment_worker: asyncio.Task[None] | None = None
+        # Async handler calls started by the worker and still running
+        self._handler_tasks: set[asyncio.Task[None]] = set()
 
         # Event handlers
-        self._segment_handlers: list[SegmentHandler | AsyncSegmentHandler] = []
+        # Replaced rather than mutated, so dispatch can iterate it without copying
+        self._segment_handlers: tuple[SegmentHandler | AsyncSegmentHandler, ...] = ()
+        # Handlers split by kind when subscriptions change, not on every segment
+        self._async_segment_handlers: tuple[AsyncSegmentHandler, ...] = ()
+        self._sync_segment_handlers: tuple[SegmentHandler | AsyncSegmentHandler, ...] = ()
 
     def subscribe(self, handler: SegmentHandler | AsyncSegmentHandler) -> None:
         """Register a handler function to receive EMWIN data segments.
@@ -541,7 +595,7 @@ class ByteBlasterClient:
 
         """
         if handler not in self._segment_handlers:
-            self._segment_handlers.append(handler)
+            self._set_segment_handlers((*self._segment_handlers, handler))
             logger.debug("Added segment handler: %s", handler)
 
     def unsubscribe(self, handler: SegmentHandler | AsyncSegmentHandler) -> None:
@@ -559,9 +613,19 @@ class ByteBlasterClient:
 
         """
         if handler in self._segment_handlers:
-            self._segment_handlers.remove(handler)
+            self._set_segment_handlers(tuple(h for h in self._segment_handlers if h != handler))
             logger.debug("Removed segment handler: %s", handler)
 
+    def _set_segment_handlers(
+        self, handlers: tuple[SegmentHandler | AsyncSegmentHandler, ...]
+    ) -> None:
+        """Replace the registered handlers and re-split them into async and sync groups."""
+        self._segment_handlers = handlers
+        self._async_segment_handlers = tuple(h for h in handlers if asyncio.iscoroutinefunction(h))
+        self._sync_segment_handlers = tuple(
+            h for h in handlers if not asyncio.iscoroutinefunction(h)
+        )
+
     def stream_segments(self, max_queue_size: int = 1000) -> SegmentStream:
         """Create an async iterator for streaming segments.
 
@@ -593,9 +657,10 @@ class ByteBlasterClient:
         to active state and begins attempting connections to available ByteBlaster
         servers with automatic failover and reconnection logic.
 
-        The start process creates the main connection loop as an async task that
-        will continue running until the client is explicitly stopped. The method
-        is idempotent and will log a warning if called on an already running client.
+        The start process creates the main connection loop and the segment worker
+        as async tasks that will continue running until the client is explicitly
+        stopped. The method is idempotent and will log a warning if called on an
+        already running client.
         """
         if self._running:
             logger.warning("Client already running")
@@ -604,7 +669,8 @@ class ByteBlasterClient:
         self._running = True
         logger.info("Starting ByteBlaster client")
 
-        # Start connection loop
+        # Start segment worker and connection loop
+        self._segment_worker = asyncio.create_task(self._process_segments())
         self._reconnect_task = asyncio.create_task(self._connection_loop())
 
     async def stop(self, shutdown_timeout: float | None = None) -> None:
@@ -619,6 +685,11 @@ class ByteBlasterClient:
         connections, and cleanup of all subsystems with configurable timeout
         constraints to prevent indefinite blocking during shutdown.
 
+        Segments already queued for handlers are still dispatched, and running async
+        handlers awaited, within the same timeout before the segment worker is stopped;
+        anything left over is cancelled or discarded so a later start() does not
+        replay it.
+
         Args:
             shutdown_timeout: Maximum time in seconds to wait for graceful shutdown of
                     background tasks. If None, waits indefinitely for clean
@@ -644,6 +715,32 @@ class ByteBlasterClient:
 
         # Close current connection
         await self._close_connection()
+
+        # Let the segment worker and its handlers finish queued segments, then stop them
+        segment_worker = self._segment_worker
+        if segment_worker and not segment_worker.done():
+            try:
+                await asyncio.wait_for(self._wait_for_segment_handlers(), timeout=shutdown_timeout)
+            except TimeoutError:
+                logger.warning("Segment handlers did not finish within shutdown timeout")
+            segment_worker.cancel()
+            try:
+                await segment_worker
+            except asyncio.CancelledError:
+                logger.debug("Segment worker cancelled during shutdown")
+        self._segment_worker = None
+
+        handler_tasks = tuple(self._handler_tasks)
+        for task in handler_tasks:
+            task.cancel()
+        await asyncio.gather(*handler_tasks, return_exceptions=True)
+
+        # Discard segments that were not dispatched so a restart does not replay them
+        queue = self._segment_queue
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+
         logger.info("ByteBlaster client stopped")
 
     @property
@@ -721,6 +818,7 @@ class ByteBlasterClient:
         """
         consecutive_failures = 0
         max_consecutive_failures = self.server_count * 2  # Try all servers twice before backing off
+        loop = asyncio.get_running_loop()
 
         try:
             while self._running:
@@ -739,14 +837,15 @@ class ByteBlasterClient:
                 )
 
                 try:
+                    # Arm before connecting so a loss during setup is not missed
+                    connection_lost = self._connection_lost = loop.create_future()
                     await self._connect_to_server(host, port)
                     consecutive_failures = 0  # Reset failure count on successful connection
 
                     logger.info("Successfully connected to %s:%d", host, port)
 
                     # Wait for connection to be lost
-                    self._connection_lost_event.clear()
-                    await self._connection_lost_event.wait()
+                    await connection_lost
 
                 except (TimeoutError, ConnectionRefusedError, OSError) as e:
                     consecutive_failures += 1
@@ -754,13 +853,12 @@ class ByteBlasterClient:
 
                     # If we've failed to connect to all servers multiple times, back off
                     if consecutive_failures >= max_consecutive_failures:
-                        backoff_delay = min(self._reconnect_delay * 4, 60.0)  # Cap at 60 seconds
                         logger.warning(
                             "All servers failed %d times, backing off for %.1f seconds",
                             consecutive_failures,
-                            backoff_delay,
+                            self._backoff_delay,
                         )
-                        await asyncio.sleep(backoff_delay)
+                        await asyncio.sleep(self._backoff_delay)
                         consecutive_failures = 0  # Reset after backoff
                         self._server_manager.reset_index()  # Start from first server again
                         continue
@@ -771,7 +869,7 @@ class ByteBlasterClient:
 
                 # Wait before trying next server (shorter delay for quick failover)
                 if self._running and consecutive_failures > 0:
-                    await asyncio.sleep(min(self._reconnect_delay, 2.0))
+                    await asyncio.sleep(self._failover_delay)
 
         except asyncio.CancelledError:
             logger.debug("Connection loop cancelled")
@@ -802,7 +900,7 @@ class ByteBlasterClient:
 
         """
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             _, protocol = await asyncio.wait_for(
                 loop.create_connection(
                     lambda: ConnectionProtocol(self),
@@ -906,7 +1004,9 @@ class ByteBlasterClient:
         """
         self._connected = False
         await self._close_connection()
-        self._connection_lost_event.set()
+        connection_lost = self._connection_lost
+        if connection_lost is not None and not connection_lost.done():
+            connection_lost.set_result(None)
 
     def on_protocol_error(self, _exc: Exception) -> None:
         """Handle protocol processing errors and update health monitoring.
@@ -967,8 +1067,8 @@ class ByteBlasterClient:
         frame types to appropriate handlers including data segments for content
         distribution and server list updates for connection management.
 
-        The method updates watchdog timing, creates async tasks for data processing,
-        and ensures all frame types are handled according to their specific
+        The method updates watchdog timing, queues data segments for the segment
+        worker, and ensures all frame types are handled according to their specific
         processing requirements.
 
         Args:
@@ -979,19 +1079,41 @@ class ByteBlasterClient:
         self._watchdog.on_data_received()
 
         if isinstance(frame, DataBlockFrame) and frame.segment:
-            # Create task for data segment handling to avoid blocking protocol processing
-            self._data_task = asyncio.create_task(self._handle_data_segment(frame.segment))
+            # Queue for the segment worker to avoid blocking protocol processing
+            self._segment_queue.put_nowait(frame.segment)
 
         elif isinstance(frame, ServerListFrame) and frame.server_list:
             self._handle_server_list_update(frame.server_list)
 
-    async def _handle_data_segment(self, segment: QBTSegment) -> None:
+    async def _process_segments(self) -> None:
+        """Hand queued data segments to the registered handlers in arrival order.
+
+        Runs as a single long-lived task for the lifetime of the client, so each
+        segment costs a queue hand-off rather than a dispatch task of its own, and
+        handlers are started in the order segments were decoded. The worker does
+        not wait for async handlers, so a slow handler never holds up the queue.
+        """
+        queue = self._segment_queue
+        while True:
+            segment = await queue.get()
+            try:
+                self._handle_data_segment(segment)
+            finally:
+                queue.task_done()
+
+    async def _wait_for_segment_handlers(self) -> None:
+        """Wait until queued segments are dispatched and their async handlers finish."""
+        await self._segment_queue.join()
+        while self._handler_tasks:
+            await asyncio.wait(tuple(self._handler_tasks))
+
+    def _handle_data_segment(self, segment: QBTSegment) -> None:
         """Process and distribute received EMWIN data segments to registered handlers.
 
         Manages the distribution of successfully received and decoded data segments
-        to all registered handler functions. The method handles both synchronous
-        and asynchronous handlers concurrently using asyncio.TaskGroup for better
-        performance and structured concurrency.
+        to all registered handler functions. Each asynchronous handler call runs as
+        its own task, so handlers run concurrently with each other and with later
+        segments; synchronous handlers are called directly.
 
         Handler errors are caught and logged but do not affect the processing of
         other handlers or the stability of the connection. This ensures that
@@ -1008,15 +1130,15 @@ class ByteBlasterClient:
             return
 
         # Process async and sync handlers separately for optimal performance
-        handlers_copy = self._segment_handlers.copy()
-        async_handlers = [h for h in handlers_copy if asyncio.iscoroutinefunction(h)]
-        sync_handlers = [h for h in handlers_copy if not asyncio.iscoroutinefunction(h)]
-
-        # Execute async handlers concurrently using TaskGroup
-        if async_handlers:
-            async with asyncio.TaskGroup() as tg:
-                for handler in async_handlers:
-                    tg.create_task(self._safe_async_handler_call(handler, segment))
+        async_handlers = self._async_segment_handlers
+        sync_handlers = self._sync_segment_handlers
+
+        # Start async handlers concurrently, keeping a reference until each finishes
+        handler_tasks = self._handler_tasks
+        for handler in async_handlers:
+            task = asyncio.create_task(self._safe_async_handler_call(handler, segment))
+            handler_tasks.add(task)
+            task.add_done_callback(handler_tasks.discard)
 
         # Execute sync handlers sequentially to avoid blocking the event loop
         for handler in sync_handlers:
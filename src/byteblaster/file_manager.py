@@ -10,12 +10,12 @@ import asyncio
 import contextlib
 import logging
 import types
-from collections import deque
 from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass
 from typing import Any, NamedTuple
 
 from byteblaster.client import ByteBlasterClient, ByteBlasterClientOptions
-from byteblaster.protocol import QBTSegment
+from byteblaster.protocol import FILLFILE_NAME, MAX_TOTAL_BLOCKS, QBTSegment
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,39 @@ class CompletedFile(NamedTuple):
 FileCompletionCallback = Callable[[CompletedFile], Coroutine[Any, Any, None]]
 
 
+@dataclass(slots=True)
+class PendingFile:
+    """Reconstruction state for a file whose segments are still arriving.
+
+    Block contents are stored in a list pre-sized to the file's block count and
+    indexed by block number, so no sorting is needed when the file completes.
+    A bitmask records which blocks have been received, distinguishing missing
+    blocks from blocks that legitimately carry empty content.
+
+    Attributes:
+        filename: The original filename as transmitted in the protocol segments.
+        blocks: Block contents indexed by block number - 1.
+        complete_mask: The received mask value once every block has arrived.
+        received_mask: Bit n is set once block n + 1 has been received.
+
+    """
+
+    filename: str
+    blocks: list[bytes]
+    complete_mask: int
+    received_mask: int = 0
+
+    @classmethod
+    def for_block_count(cls, filename: str, total_blocks: int) -> "PendingFile":
+        """Create empty reconstruction state for a file of ``total_blocks`` blocks."""
+        return cls(filename, [b""] * total_blocks, (1 << total_blocks) - 1)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every block of the file has been received."""
+        return self.received_mask == self.complete_mask
+
+
 class FileStream:
     """Async iterator for streaming completed files with backpressure support.
 
@@ -156,8 +189,10 @@ class FileAssembler:
 
         """
         self.on_file_completed = on_file_completed
-        self.file_segments: dict[str, list[QBTSegment]] = {}
-        self._recently_completed: deque[str] = deque(maxlen=duplicate_cache_size)
+        self.file_segments: dict[str, PendingFile] = {}
+        # Insertion-ordered dict used as a bounded FIFO set for O(1) membership checks
+        self._recently_completed: dict[str, None] = {}
+        self._duplicate_cache_size = duplicate_cache_size
 
     async def handle_segment(self, segment: QBTSegment) -> None:
         """Process an incoming data segment and attempt file reconstruction.
@@ -168,8 +203,8 @@ class FileAssembler:
         attempting file reconstruction.
 
         The processing workflow includes:
-        1. Duplicate file detection using the completion cache
-        2. Filtering of filler data (FILLFILE.TXT segments)
+        1. Filtering of filler data (FILLFILE.TXT segments)
+        2. Duplicate file detection using the completion cache
         3. Duplicate segment detection within the same file
         4. Segment aggregation and completeness checking
         5. Automatic file reconstruction when all segments are received
@@ -182,6 +217,12 @@ class FileAssembler:
                 information received from the ByteBlaster protocol stream.
 
         """
+        # Skip FILLFILE.TXT - it's filler data when no real data is being transmitted.
+        # Checked first so filler traffic never builds a key or touches the caches.
+        filename = segment.filename
+        if filename == FILLFILE_NAME:
+            return
+
         file_key = segment.key
 
         # Check if this is a duplicate of a recently completed file
@@ -189,53 +230,68 @@ class FileAssembler:
             logger.debug("Skipping segment for duplicate file: %s", file_key)
             return
 
-        # Skip FILLFILE.TXT - it's filler data when no real data is being transmitted
-        if segment.filename == "FILLFILE.TXT":
+        # Group segments by file key, pre-sizing block slots on the first segment.
+        # The block count comes from an unchecked header field, so bound it first.
+        pending = self.file_segments.get(file_key)
+        if pending is None:
+            total_blocks = segment.total_blocks
+            if not 1 <= total_blocks <= MAX_TOTAL_BLOCKS:
+                logger.warning(
+                    "Skipping segment with invalid block count: %s, %s blocks",
+                    file_key,
+                    total_blocks,
+                )
+                return
+            pending = PendingFile.for_block_count(filename, total_blocks)
+            self.file_segments[file_key] = pending
+
+        block_number = segment.block_number
+        blocks = pending.blocks
+        index = block_number - 1
+        if not 0 <= index < len(blocks):
+            logger.warning(
+                "Skipping out of range segment: %s, block %s/%s",
+                file_key,
+                block_number,
+                len(blocks),
+            )
             return
 
-        # Group segments by file key
-        if file_key not in self.file_segments:
-            self.file_segments[file_key] = []
-
-        # Check for duplicate segments before appending
-        if any(s.block_number == segment.block_number for s in self.file_segments[file_key]):
-            logger.debug("Skipping duplicate segment: %s, block %s", file_key, segment.block_number)
+        # Check for duplicate segments before storing
+        block_bit = 1 << index
+        if pending.received_mask & block_bit:
+            logger.debug("Skipping duplicate segment: %s, block %s", file_key, block_number)
             return
 
-        self.file_segments[file_key].append(segment)
+        blocks[index] = segment.content
+        pending.received_mask |= block_bit
 
         # Check if we have all segments for this file
-        segments = self.file_segments[file_key]
-        if len(segments) == segment.total_blocks:
-            await self._reconstruct_and_notify(file_key, segments)
+        if pending.is_complete:
+            await self._reconstruct_and_notify(file_key, pending)
 
-    async def _reconstruct_and_notify(self, file_key: str, segments: list[QBTSegment]) -> None:
+    async def _reconstruct_and_notify(self, file_key: str, pending: PendingFile) -> None:
         """Reconstruct a file from its segments and notify the consumer."""
         try:
-            # Sort segments by block number
-            segments.sort(key=lambda s: s.block_number)
-
-            # Combine content
-            complete_data = b"".join(segment.content for segment in segments)
-
-            # Get filename from first segment
-            filename = segments[0].filename
+            # Combine content; blocks are already in order
+            complete_data = b"".join(pending.blocks)
 
             # Create completed file object
-            completed_file = CompletedFile(filename=filename, data=complete_data)
+            completed_file = CompletedFile(filename=pending.filename, data=complete_data)
 
             # Notify consumer
             await self.on_file_completed(completed_file)
 
             # Add to cache to prevent processing duplicates
-            self._recently_completed.append(file_key)
+            self._recently_completed[file_key] = None
+            if len(self._recently_completed) > self._duplicate_cache_size:
+                del self._recently_completed[next(iter(self._recently_completed))]
             logger.debug("Added file key to duplicate cache: %s", file_key)
         except Exception:
             logger.exception("Error reconstructing file %s", file_key)
         finally:
             # Clean up segments from memory
-            if file_key in self.file_segments:
-                del self.file_segments[file_key]
+            self.file_segments.pop(file_key, None)
 
 
 class ByteBlasterFileManager:
@@ -286,6 +342,8 @@ class ByteBlasterFileManager:
         self._assembler = FileAssembler(self._dispatch_file)
         self._client.subscribe(self._assembler.handle_segment)
         self._file_handlers: list[FileCompletionCallback] = []
+        # Immutable copy iterated by _dispatch_file, rebuilt only when subscriptions change
+        self._handlers_snapshot: tuple[FileCompletionCallback, ...] = ()
 
     @property
     def client(self) -> ByteBlasterClient:
@@ -322,9 +380,10 @@ class ByteBlasterFileManager:
         to subscribe the same handler multiple times will not create duplicate
         subscriptions.
 
-        All registered handlers are executed concurrently using asyncio.TaskGroup
-        for better performance and structured concurrency. Handler errors are
-        isolated and logged but do not affect other handlers.
+        All registered handlers are executed concurrently. Each handler is started
+        eagerly, so handlers that complete without suspending never touch the
+        event loop. Handler errors are isolated and logged but do not affect
+        other handlers.
 
         Args:
             handler: Async callback function that accepts a CompletedFile object
@@ -334,6 +393,7 @@ class ByteBlasterFileManager:
         """
         if handler not in self._file_handlers:
             self._file_handlers.append(handler)
+            self._handlers_snapshot = tuple(self._file_handlers)
 
     def unsubscribe(self, handler: FileCompletionCallback) -> None:
         """Remove a handler from the completed file event subscription list.
@@ -358,6 +418,8 @@ class ByteBlasterFileManager:
             self._file_handlers.remove(handler)
         except ValueError:
             logger.warning("Handler not found in subscribers list.")
+        else:
+            self._handlers_snapshot = tuple(self._file_handlers)
 
     def stream_files(self, max_queue_size: int = 100) -> FileStream:
         """Create an async iterator for streaming completed files.
@@ -383,19 +445,29 @@ class ByteBlasterFileManager:
         return FileStream(self, max_queue_size)
 
     async def _dispatch_file(self, file: CompletedFile) -> None:
-        """Dispatch a completed file to all subscribed handlers using TaskGroup.
+        """Dispatch a completed file to all subscribed handlers.
 
-        Uses asyncio.TaskGroup for better error handling and structured concurrency.
-        If any handler fails, the error is logged but other handlers continue processing.
+        Each handler is started as an eager task, running synchronously up to its
+        first suspension point. Handlers that finish without suspending complete
+        immediately and are never scheduled on the event loop; only the ones still
+        running are awaited. If any handler fails, the error is logged but other
+        handlers continue processing.
         """
         logger.debug("Dispatching completed file: %s", file.filename)
 
-        if not self._file_handlers:
+        handlers = self._handlers_snapshot
+        if not handlers:
             return
 
-        async with asyncio.TaskGroup() as tg:
-            for handler in self._file_handlers:
-                tg.create_task(self._safe_handler_call(handler, file))
+        loop = asyncio.get_running_loop()
+        pending: list[asyncio.Task[None]] = []
+        for handler in handlers:
+            task = asyncio.Task(self._safe_handler_call(handler, file), loop=loop, eager_start=True)
+            if not task.done():
+                pending.append(task)
+
+        if pending:
+            await asyncio.gather(*pending)
 
     async def _safe_handler_call(
         self,
@@ -1,9 +1,10 @@
 """Handler for processing weather data segments from ByteBlaster."""
 
+import asyncio
 import logging
 from pathlib import Path
 
-from byteblaster.protocol.models import QBTSegment
+from byteblaster.protocol.models import FILLFILE_NAME, MAX_TOTAL_BLOCKS, QBTSegment
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,9 @@ class WeatherDataHandler:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.file_segments: dict[str, list[QBTSegment]] = {}
+        self.file_segments: dict[str, list[QBTSegment | None]] = {}
+        self._received_masks: dict[str, int] = {}
+        self._ensured_dirs: set[Path] = {self.output_dir}
 
     async def handle_segment(self, segment: QBTSegment) -> None:
         """Process an incoming weather data segment and trigger reconstruction when complete.
@@ -59,9 +62,9 @@ class WeatherDataHandler:
         The processing flow includes:
         1. Filtering out FILLFILE.TXT segments to ignore filler transmissions
         2. Grouping segments by file key to handle concurrent multi-file transfers
-        3. Adding the segment to the appropriate file's segment collection
+        3. Placing the segment in its block slot of the file's pre-sized segment list
         4. Checking if all segments for a file have been received
-        5. Triggering file reconstruction when the segment count matches total_blocks
+        5. Triggering file reconstruction once every block bit of the file is set
 
         Debug logging tracks segment reception progress, and file reconstruction is
         automatically initiated when complete segment sets are detected. The method
@@ -74,43 +77,70 @@ class WeatherDataHandler:
 
         """
         # Skip FILLFILE.TXT - it's filler data when no real data is being transmitted
-        if segment.filename == "FILLFILE.TXT":
+        filename = segment.filename
+        if filename == FILLFILE_NAME:
             return
 
-        logger.debug(
-            "Received: %s block %d/%d",
-            segment.filename,
-            segment.block_number,
-            segment.total_blocks,
-        )
+        block_number = segment.block_number
+        total_blocks = segment.total_blocks
+        logger.debug("Received: %s block %d/%d", filename, block_number, total_blocks)
 
-        # Group segments by file key
+        # Group segments by file key into a list pre-sized to the block count. The
+        # count comes from an unchecked header field, so bound it before allocating.
         file_key = segment.key
-        if file_key not in self.file_segments:
-            self.file_segments[file_key] = []
+        existing = self.file_segments.get(file_key)
+        if existing is None:
+            if not 1 <= total_blocks <= MAX_TOTAL_BLOCKS:
+                logger.warning(
+                    "Ignoring invalid block count: %s block %d/%d",
+                    filename,
+                    block_number,
+                    total_blocks,
+                )
+                return
+            segments: list[QBTSegment | None] = [None] * total_blocks
+            self.file_segments[file_key] = segments
+            self._received_masks[file_key] = 0
+        else:
+            segments = existing
+
+        index = block_number - 1
+        if not 0 <= index < len(segments):
+            logger.warning(
+                "Ignoring out of range block: %s block %d/%d",
+                filename,
+                block_number,
+                len(segments),
+            )
+            return
 
-        self.file_segments[file_key].append(segment)
+        # Store the segment in its block slot and mark the block as received
+        segments[index] = segment
+        received_mask = self._received_masks[file_key] | (1 << index)
+        self._received_masks[file_key] = received_mask
 
-        # Check if we have all segments for this file
-        segments = self.file_segments[file_key]
-        if len(segments) == segment.total_blocks:
+        # Check if we have all segments for this file (every block bit set)
+        if received_mask == (1 << len(segments)) - 1:
             await self._reconstruct_file(file_key, segments)
 
-    async def _reconstruct_file(self, file_key: str, segments: list[QBTSegment]) -> None:
+    async def _reconstruct_file(self, file_key: str, segments: list[QBTSegment | None]) -> None:
         """Reconstruct a complete file from its segments and write to disk.
 
-        This method handles the final phase of file reconstruction by sorting segments
-        in the correct order, combining their content, and writing the complete file
-        to the output directory. It includes comprehensive error handling for file
-        system operations and automatic cleanup of memory resources.
+        This method handles the final phase of file reconstruction by streaming the
+        content of the already ordered segments into the file in the output directory,
+        without first concatenating them into one buffer. It includes comprehensive
+        error handling for file system operations and automatic cleanup of memory
+        resources.
 
         The reconstruction process includes:
-        1. Sorting segments by block number to ensure correct file ordering
-        2. Concatenating segment content in sequence to rebuild the original file
-        3. Creating necessary parent directories for the output path
-        4. Writing the complete file data with proper error handling
+        1. Cleaning up the segment collection from memory to prevent leaks
+        2. Creating necessary parent directories for the output path
+        3. Writing segment content in block order to rebuild the original file
+        4. Handling write errors without interrupting other files
         5. Logging success/failure status with file size information
-        6. Cleaning up the segment collection from memory to prevent leaks
+
+        Directory creation and the file write run in a worker thread so the event
+        loop keeps processing segments while the disk is busy.
 
         File system errors during write operations are caught and logged without
         crashing the handler, allowing processing to continue for other files.
@@ -119,32 +149,43 @@ class WeatherDataHandler:
 
         Args:
             file_key: Unique identifier for the file being reconstructed.
-            segments: Complete list of segments containing all blocks for the file.
+            segments: Complete list of segments for the file, indexed by block number - 1.
 
         Raises:
             OSError: File system errors during directory creation or file writing
                     are caught and logged rather than propagated.
 
         """
-        # Sort segments by block number
-        segments.sort(key=lambda s: s.block_number)
+        # Release the segments before the first await so that late duplicate blocks
+        # start a new entry instead of triggering a second reconstruction
+        self.file_segments.pop(file_key, None)
+        self._received_masks.pop(file_key, None)
 
-        # Combine content
-        complete_data = b"".join(segment.content for segment in segments)
+        # Segments are already stored in block order
+        present = [segment for segment in segments if segment is not None]
 
         # Get filename from first segment
-        filename = segments[0].filename
+        filename = present[0].filename
         output_path = self.output_dir / filename
 
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists, creating each directory only once
+        parent_dir = output_path.parent
+        if parent_dir not in self._ensured_dirs:
+            await asyncio.to_thread(parent_dir.mkdir, parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent_dir)
 
-        # Write file
+        # Write file off the event loop so segment ingest is not blocked
         try:
-            output_path.write_bytes(complete_data)
-            logger.info("✓ Saved complete file: %s (%d bytes)", output_path, len(complete_data))
+            size = await asyncio.to_thread(self._write_segments, output_path, present)
+            logger.info("✓ Saved complete file: %s (%d bytes)", output_path, size)
         except OSError:
             logger.exception("✗ Failed to save %s", output_path)
 
-        # Clean up segments from memory
-        del self.file_segments[file_key]
+    @staticmethod
+    def _write_segments(output_path: Path, segments: list[QBTSegment]) -> int:
+        """Write segment contents to a file in order, returning the number of bytes written."""
+        size = 0
+        with output_path.open("wb") as output_file:
+            for segment in segments:
+                size += output_file.write(segment.content)
+        return size
@@ -8,6 +8,8 @@ protocol decoding, authentication, and data models.
 from .auth import AuthenticationHandler
 from .decoder import ProtocolDecoder
 from .models import (
+    FILLFILE_NAME,
+    MAX_TOTAL_BLOCKS,
     ByteBlasterServerList,
     DataBlockFrame,
     ProtocolFrame,
@@ -16,6 +18,8 @@ from .models import (
 )
 
 __all__ = [
+    "FILLFILE_NAME",
+    "MAX_TOTAL_BLOCKS",
     "AuthenticationHandler",
     "ByteBlasterServerList",
     "DataBlockFrame",
@@ -5,14 +5,17 @@ ByteBlaster protocol state machine for parsing incoming data streams into
 protocol frames and data segments.
 """
 
+import functools
 import logging
 import re
-import zlib
+import sys
 from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
+from typing import ClassVar
 
 from byteblaster.protocol.models import (
+    FILLFILE_NAME,
     ByteBlasterServerList,
     DataBlockFrame,
     ProtocolFrame,
@@ -23,6 +26,18 @@ from byteblaster.utils.crypto import XorBuffer, decompress_zlib, verify_checksum
 
 logger = logging.getLogger(__name__)
 
+# File extensions whose final block is padded and gets trimmed
+_TEXT_FILE_SUFFIXES = (".TXT", ".WMO")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_text_file(filename: str) -> bool:
+    """Return whether a segment filename names a padded text file.
+
+    Cached per filename, since every block of a file repeats the same name.
+    """
+    return filename.upper().endswith(_TEXT_FILE_SUFFIXES)
+
 
 class DecoderState(Enum):
     """Enumeration of protocol decoder states in the ByteBlaster state machine.
@@ -93,9 +108,17 @@ class ProtocolDecoder:
 
     # Protocol constants
     FRAME_SYNC_BYTES = 6
+    FRAME_SYNC_PATTERN = b"\x00" * FRAME_SYNC_BYTES
+    DATA_BLOCK_PREFIX = b"/PF"
+    SERVER_LIST_PREFIX = b"/Se"
+    FRAME_TYPE_STATES: ClassVar[dict[bytes, DecoderState]] = {
+        DATA_BLOCK_PREFIX: DecoderState.BLOCK_HEADER,
+        SERVER_LIST_PREFIX: DecoderState.SERVER_LIST,
+    }
     HEADER_SIZE = 80
     V1_BODY_SIZE = 1024
     MAX_V2_BODY_SIZE = 1024
+    MAX_SERVER_LIST_SIZE = 16384
 
     # Header regex for parsing (matches both V1 and V2)
     HEADER_REGEX = re.compile(
@@ -132,6 +155,20 @@ class ProtocolDecoder:
         self._current_segment: QBTSegment | None = None
         self._frame_handler = frame_handler
         self._remote_address = ""
+        # Arrival time of the data being fed, shared by every frame decoded from it
+        self._received_at = datetime.now(UTC)
+        # Most recent raw /FD header field and its parsed timestamp
+        self._last_header_date: tuple[bytes, datetime] | None = None
+        # State machine handlers, looked up once per processing step
+        self._state_handlers: dict[DecoderState, Callable[[], bool]] = {
+            DecoderState.RESYNC: self._handle_resync,
+            DecoderState.START_FRAME: self._handle_start_frame,
+            DecoderState.FRAME_TYPE: self._handle_frame_type,
+            DecoderState.SERVER_LIST: self._handle_server_list,
+            DecoderState.BLOCK_HEADER: self._handle_block_header,
+            DecoderState.BLOCK_BODY: self._handle_block_body,
+            DecoderState.VALIDATE: self._handle_validate,
+        }
 
     @property
     def state(self) -> DecoderState:
@@ -205,14 +242,17 @@ class ProtocolDecoder:
         incomplete data sequences.
 
         Processing Flow:
-        1. Appends incoming data to the internal XOR buffer
+        1. Records the arrival time and appends data to the internal XOR buffer
         2. Triggers state machine processing to parse buffered content
         3. Automatically handles frame boundaries and state transitions
         4. Emits completed frames via the configured frame handler
+        5. Compacts the buffer, releasing the bytes consumed by this call
 
         The method processes all available buffered data in the current call,
         potentially completing multiple frames if sufficient data is available.
         Partial frames remain buffered for completion when additional data arrives.
+        All frames and segments completed by one call share a single arrival
+        timestamp, so the clock is read once per network read rather than per frame.
 
         Error Recovery:
         If processing encounters invalid data or corruption, the decoder automatically
@@ -225,8 +265,11 @@ class ProtocolDecoder:
                 sizes efficiently through internal buffering.
 
         """
+        self._received_at = datetime.now(UTC)
         self._buffer.append(data)
         self._process_buffer()
+        # Drop consumed bytes so only a partial frame is held between reads
+        self._buffer.compact()
 
     def reset(self) -> None:
         """Reset the decoder to initial state, clearing all buffers and progress.
@@ -257,25 +300,13 @@ class ProtocolDecoder:
             if not self._process_current_state():
                 break
 
-    def _process_current_state(self) -> bool:  # noqa: PLR0911
+    def _process_current_state(self) -> bool:
         """Process current state and return True if should continue."""
-        if self._state == DecoderState.RESYNC:
-            return self._handle_resync()
-        if self._state == DecoderState.START_FRAME:
-            return self._handle_start_frame()
-        if self._state == DecoderState.FRAME_TYPE:
-            return self._handle_frame_type()
-        if self._state == DecoderState.SERVER_LIST:
-            return self._handle_server_list()
-        if self._state == DecoderState.BLOCK_HEADER:
-            return self._handle_block_header()
-        if self._state == DecoderState.BLOCK_BODY:
-            return self._handle_block_body()
-        if self._state == DecoderState.VALIDATE:
-            return self._handle_validate()
-
-        msg = f"Unknown decoder state: {self._state}"
-        raise RuntimeError(msg)
+        handler = self._state_handlers.get(self._state)
+        if handler is None:
+            msg = f"Unknown decoder state: {self._state}"
+            raise RuntimeError(msg)
+        return handler()
 
     def _handle_resync(self) -> bool:
         """Handle RESYNC state."""
@@ -334,13 +365,12 @@ class ProtocolDecoder:
             return False
 
         # Look for 6 consecutive null bytes when decoded
-        for start_pos in range(self._buffer.available() - self.FRAME_SYNC_BYTES + 1):
-            sync_data = self._buffer.peek(self.FRAME_SYNC_BYTES, start_pos)
-            if sync_data == b"\x00" * self.FRAME_SYNC_BYTES:
-                # Found sync pattern, skip to just after it
-                self._buffer.skip(start_pos + self.FRAME_SYNC_BYTES)
-                logger.debug("Frame synchronization found at position %d", start_pos)
-                return True
+        start_pos = self._buffer.find(self.FRAME_SYNC_PATTERN)
+        if start_pos >= 0:
+            # Found sync pattern, skip to just after it
+            self._buffer.skip(start_pos + self.FRAME_SYNC_BYTES)
+            logger.debug("Frame synchronization found at position %d", start_pos)
+            return True
 
         # No sync found, keep the last 5 bytes in case sync spans chunks
         if self._buffer.available() > self.FRAME_SYNC_BYTES:
@@ -356,17 +386,9 @@ class ProtocolDecoder:
             True if non-null byte found, False if need more data
 
         """
-        while self._buffer.available() > 0:
-            byte_data = self._buffer.peek(1)
-            if not byte_data:
-                return False
-
-            if byte_data[0] != 0x00:  # Found non-null byte
-                return True
-
-            self._buffer.skip(1)
-
-        return False
+        self._buffer.skip_leading(b"\x00")
+        # Anything left now starts with a non-null byte
+        return self._buffer.available() > 0
 
     def _determine_frame_type(self) -> bool:
         """Determine frame type by examining header.
@@ -379,20 +401,15 @@ class ProtocolDecoder:
         if self._buffer.available() < 10:
             return False
 
-        # Peek at first 20 bytes to determine type
-        header_start = self._buffer.peek(min(20, self._buffer.available()))
-
-        if self._is_data_block_header(header_start):
-            self._state = DecoderState.BLOCK_HEADER
-            logger.debug("Detected data block frame")
-            return True
-
-        if self._is_server_list_header(header_start):
-            self._state = DecoderState.SERVER_LIST
-            logger.debug("Detected server list frame")
+        # The first three bytes select the frame type
+        next_state = self.FRAME_TYPE_STATES.get(self._buffer.peek(3))
+        if next_state is not None:
+            self._state = next_state
+            logger.debug("Detected frame type: %s", next_state.name)
             return True
 
         # Unknown frame type
+        header_start = self._buffer.peek(min(20, self._buffer.available()))
         header_str = header_start.decode("ascii", errors="replace")
         logger.warning("Unknown frame type, header starts: %r", header_str)
         # Skip this byte and try to resync
@@ -400,66 +417,30 @@ class ProtocolDecoder:
         self._state = DecoderState.RESYNC
         return True
 
-    @staticmethod
-    def _is_data_block_header(header_data: bytes) -> bool:
-        """Check if header indicates a data block.
-
-        Args:
-            header_data: Decoded header bytes
-
-        Returns:
-            True if data block header detected
-
-        """
-        return (
-            len(header_data) >= 3
-            and header_data[0] == ord("/")
-            and header_data[1] == ord("P")
-            and header_data[2] == ord("F")
-        )
-
-    @staticmethod
-    def _is_server_list_header(header_data: bytes) -> bool:
-        """Check if header indicates a server list.
-
-        Args:
-            header_data: Decoded header bytes
-
-        Returns:
-            True if server list header detected
-
-        """
-        return (
-            len(header_data) >= 3
-            and header_data[0] == ord("/")
-            and header_data[1] == ord("S")
-            and header_data[2] == ord("e")
-        )
-
     def _process_server_list(self) -> bool:
         """Process server list frame.
 
         Returns:
             True if frame processed, False if need more data
 
+        Raises:
+            ValueError: If no terminator arrives within MAX_SERVER_LIST_SIZE bytes
+
         """
-        # Read until null terminator or end marker
+        # Read until the null terminator; the frame is incomplete until one arrives
         content = self._read_null_terminated_string()
         if content is None:
-            # Look for end pattern if no null terminator found
-            available_data = self._buffer.peek(self._buffer.available())
-            end_pattern = b"\\SatServers\\\x00"
-            if end_pattern in available_data:
-                end_pos = available_data.find(end_pattern) + len(end_pattern)
-                content = self._buffer.read(end_pos - 1).decode("ascii", errors="replace")
-                self._buffer.skip(1)  # Skip final null
-            else:
+            if self._buffer.available() <= self.MAX_SERVER_LIST_SIZE:
                 return False
+            # No terminator within any plausible frame length: treat as corruption
+            msg = f"Server list exceeds {self.MAX_SERVER_LIST_SIZE} bytes without terminator"
+            raise ValueError(msg)
 
         try:
             server_list = ByteBlasterServerList.from_server_list_frame(content)
             frame = ServerListFrame(
                 content=content.encode("ascii"),
+                timestamp=self._received_at,
                 server_list=server_list,
             )
             self._emit_frame(frame)
@@ -483,11 +464,11 @@ class ProtocolDecoder:
         header_data = self._buffer.read(self.HEADER_SIZE)
         header_str = header_data.decode("ascii", errors="replace")
 
-        logger.debug("Processing header: %s", header_str.strip())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing header: %s", header_str.strip())
 
-        # Parse header with regex
-        header_bytes = header_str.encode("ascii")
-        match = self.HEADER_REGEX.match(header_bytes)
+        # Parse header with regex; the pattern is bytes, so match the raw header
+        match = self.HEADER_REGEX.match(header_data)
 
         if not match:
             msg = f"Invalid header format: {header_str}"
@@ -507,32 +488,39 @@ class ProtocolDecoder:
             QBTSegment with parsed header data
 
         """
-        groups = match.groupdict()
-
-        # Parse basic fields
-        filename = groups["PF"].decode("ascii")
-        block_number = int(groups["PN"])
-        total_blocks = int(groups["PT"])
-        checksum = int(groups["CS"])
-
-        # Parse timestamp
-        timestamp = datetime.now(UTC)
-        date_str = ""
-        try:
-            date_str = groups["FD"].decode("ascii")
-            parsed_time = datetime.strptime(date_str, self.HEADER_DATE_FORMAT).astimezone(UTC)
-            timestamp = parsed_time.replace(tzinfo=UTC)
-        except (ValueError, KeyError) as e:
-            logger.warning("Failed to parse header date '%s': %s", date_str, e)
-
-        # Determine version and length
-        version = 1
-        length = self.V1_BODY_SIZE
+        pf, pn, pt, cs, date_field, dl = match.group("PF", "PN", "PT", "CS", "FD", "DL")
+
+        # Parse basic fields; filenames repeat across segments so intern them
+        filename = sys.intern(pf.decode("ascii"))
+        block_number = int(pn)
+        total_blocks = int(pt)
+        checksum = int(cs)
+
+        # Parse timestamp, falling back to the arrival time. Every block of a file
+        # carries the same date, so reuse the last parse when the field repeats.
+        received_at = self._received_at
+        timestamp = received_at
+        last_header_date = self._last_header_date
+        if last_header_date is not None and last_header_date[0] == date_field:
+            timestamp = last_header_date[1]
+        else:
+            date_str = ""
+            try:
+                date_str = date_field.decode("ascii")
+                timestamp = self._parse_header_date(date_str)
+            except ValueError as e:
+                logger.warning("Failed to parse header date '%s': %s", date_str, e)
+            else:
+                self._last_header_date = (date_field, timestamp)
 
-        if groups.get("DL"):
+        # Determine version and length; only V2 headers carry /DL
+        if dl is None:
+            version = 1
+            length = self.V1_BODY_SIZE
+        else:
             version = 2
-            length = int(groups["DL"])
-            if length <= 0 or length > self.MAX_V2_BODY_SIZE:
+            length = int(dl)
+            if not 1 <= length <= self.MAX_V2_BODY_SIZE:
                 msg = f"Invalid V2 length: {length} (must be 1-{self.MAX_V2_BODY_SIZE})"
                 raise ValueError(msg)
 
@@ -544,10 +532,43 @@ class ProtocolDecoder:
             length=length,
             version=version,
             timestamp=timestamp,
+            received_at=received_at,
             header=header_str,
             source=self._remote_address,
         )
 
+    @classmethod
+    def _parse_header_date(cls, date_str: str) -> datetime:
+        """Parse a header date such as '12/25/2023 10:30:00 AM' into a UTC timestamp.
+
+        Splits the fixed header layout directly instead of going through strptime,
+        which interprets its format string on every call. Anything the fast path
+        cannot split falls back to strptime with HEADER_DATE_FORMAT. Either way the
+        header time is read as host local time and converted to UTC.
+
+        Args:
+            date_str: Date text from the /FD header field
+
+        Returns:
+            Timezone-aware datetime in UTC
+
+        Raises:
+            ValueError: If the date cannot be parsed
+
+        """
+        try:
+            date_part, time_part, meridiem = date_str.split()
+            month, day, year = map(int, date_part.split("/"))
+            hour, minute, second = map(int, time_part.split(":"))
+        except ValueError:
+            pass
+        else:
+            if year >= 1000 and 1 <= hour <= 12 and meridiem in ("AM", "PM"):
+                hour = hour % 12 + (12 if meridiem == "PM" else 0)
+                return datetime(year, month, day, hour, minute, second).astimezone(UTC)
+
+        return datetime.strptime(date_str, cls.HEADER_DATE_FORMAT).astimezone(UTC)
+
     def _process_block_body(self) -> bool:
         """Process data block body.
 
@@ -604,7 +625,7 @@ class ProtocolDecoder:
             return True
 
         # Skip FILLFILE.TXT - it's filler when no data is being transmitted
-        if segment.filename == "FILLFILE.TXT":
+        if segment.filename == FILLFILE_NAME:
             logger.debug("Skipping FILLFILE.TXT (filler data)")
             return True
 
@@ -615,21 +636,23 @@ class ProtocolDecoder:
         # The last block of a transmission may not be fully populated with content,
         # and for text files, this padding should be removed. The protocol specifies
         # null padding, but some sources may use whitespace.
-        if segment.filename.upper().endswith((".TXT", ".WMO")):
+        if _is_text_file(segment.filename):
             segment.content = segment.content.rstrip(b"\x00 \t\r\n")
 
         # Emit segment regardless of checksum status for data collection
         frame = DataBlockFrame(
             content=segment.content,
+            timestamp=self._received_at,
             segment=segment,
         )
         self._emit_frame(frame)
 
-        logger.debug(
-            "Processed segment: %s (checksum %s)",
-            segment,
-            "valid" if checksum_valid else "invalid",
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Processed segment: %s (checksum %s)",
+                segment,
+                "valid" if checksum_valid else "invalid",
+            )
         return True
 
     def _validate_segment_checksum(self, segment: QBTSegment) -> bool:
@@ -674,75 +697,13 @@ class ProtocolDecoder:
         return checksum_valid
 
     def _validate_v2_checksum(self, segment: QBTSegment) -> bool:
-        """Validate V2 protocol checksum with compression support.
-
-        Args:
-            segment: Segment to validate
-
-        Returns:
-            True if checksum is valid
-
-        """
-        # Check if data is compressed (starts with zlib header)
-        if self._is_compressed_data(segment.content):
-            return self._validate_compressed_data(segment)
-        return self._validate_uncompressed_v2_data(segment)
-
-    def _is_compressed_data(self, content: bytes) -> bool:
-        """Check if data appears to be zlib compressed.
-
-        Args:
-            content: Data to check
-
-        Returns:
-            True if data appears compressed
-
-        """
-        return len(content) >= 2 and content[:2] in (b"\x78\x9c", b"\x78\xda", b"\x78\x01")
-
-    def _validate_compressed_data(self, segment: QBTSegment) -> bool:
-        """Validate compressed V2 data.
-
-        Args:
-            segment: Segment with compressed data
-
-        Returns:
-            True if checksum is valid
-
-        """
-        try:
-            uncompressed_data = zlib.decompress(segment.content)
-
-            # Checksum should be calculated on uncompressed data
-            if verify_checksum(uncompressed_data, segment.checksum):
-                segment.content = uncompressed_data
-                logger.debug(
-                    "V2 compressed data decompressed and validated for %s",
-                    segment.filename,
-                )
-                return True
-
-            logger.warning(
-                "V2 compressed checksum validation failed for %s: expected %d, "
-                "calculated %d (uncompressed length: %d)",
-                segment.filename,
-                segment.checksum,
-                sum(uncompressed_data) & 0xFFFF,
-                len(uncompressed_data),
-            )
-
-        except (OSError, ValueError) as e:
-            logger.warning("V2 decompression failed for %s: %s", segment.filename, e)
-            # Fall back to treating as uncompressed
-            return verify_checksum(segment.content, segment.checksum)
-
-        return False
+        """Validate V2 protocol checksum.
 
-    def _validate_uncompressed_v2_data(self, segment: QBTSegment) -> bool:
-        """Validate uncompressed V2 data.
+        V2 bodies are inflated once in _process_block_body, so the checksum is
+        verified against the content as stored on the segment.
 
         Args:
-            segment: Segment with uncompressed data
+            segment: Segment with decompressed data
 
         Returns:
             True if checksum is valid
@@ -751,8 +712,7 @@ class ProtocolDecoder:
         checksum_valid = verify_checksum(segment.content, segment.checksum)
         if not checksum_valid:
             logger.warning(
-                "V2 uncompressed checksum validation failed for %s: expected %d, "
-                "calculated %d (length: %d)",
+                "V2 checksum validation failed for %s: expected %d, calculated %d (length: %d)",
                 segment.filename,
                 segment.checksum,
                 sum(segment.content) & 0xFFFF,
@@ -768,15 +728,14 @@ class ProtocolDecoder:
 
         """
         # Scan for null terminator
-        for i in range(self._buffer.available()):
-            byte_data = self._buffer.peek(1, i)
-            if byte_data and byte_data[0] == 0x00:
-                # Found terminator, read up to it
-                string_data = self._buffer.read(i)
-                self._buffer.skip(1)  # Skip the null terminator
-                return string_data.decode("ascii", errors="replace")
-
-        return None
+        end = self._buffer.find(b"\x00")
+        if end < 0:
+            return None
+
+        # Found terminator, read up to it
+        string_data = self._buffer.read(end)
+        self._buffer.skip(1)  # Skip the null terminator
+        return string_data.decode("ascii", errors="replace")
 
     def _emit_frame(self, frame: ProtocolFrame) -> None:
         """Emit frame to handler if available.
@@ -5,16 +5,25 @@ including QuickBlockTransferSegment for data blocks and ByteBlasterServerList
 for server management.
 """
 
+import functools
 import logging
-import re
+import sys
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import ClassVar
 
 logger = logging.getLogger(__name__)
 
+# Filename of the filler file sent when no real data is being transmitted. Interned so
+# that equality checks against interned segment filenames reduce to an identity check.
+FILLFILE_NAME = sys.intern("FILLFILE.TXT")
 
-@dataclass
+# Upper bound on the block count (/PT) of a file. The header field is not covered by
+# any checksum, so consumers that pre-size per-block storage reject larger counts.
+MAX_TOTAL_BLOCKS = 65535
+
+
+@dataclass(slots=True)
 class QBTSegment:
     """Represents a single data block in the Quick Block Transfer (QBT) protocol.
 
@@ -57,16 +66,17 @@ class QBTSegment:
     def key(self) -> str:
         """Generate a unique identifier for this segment based on filename and timestamp.
 
-        Creates a composite key by combining the segment's filename with its ISO-formatted
-        timestamp, providing a unique identifier that can be used for tracking, caching,
-        or deduplication purposes. The timestamp is formatted in ISO 8601 standard to
-        ensure consistent string representation across different systems and time zones.
+        Creates a composite key by combining the segment's filename with its timestamp
+        as whole seconds since the Unix epoch, providing a unique identifier that can be
+        used for tracking, caching, or deduplication purposes. Header dates carry only
+        whole seconds, and an epoch integer is independent of the timestamp's time zone
+        and much cheaper to format than an ISO 8601 string.
 
         Returns:
-            A string in the format "filename_timestamp" where timestamp is ISO-formatted.
+            A string in the format "filename_timestamp" where timestamp is epoch seconds.
 
         """
-        return f"{self.filename}_{self.timestamp.isoformat()}".lower()
+        return f"{self.filename}_{int(self.timestamp.timestamp())}".lower()
 
     def __str__(self) -> str:
         """Generate a human-readable string representation of this QBT segment.
@@ -90,7 +100,7 @@ class QBTSegment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ByteBlasterServerList:
     """Manages ByteBlaster server connection endpoints for weather data distribution.
 
@@ -121,10 +131,11 @@ class ByteBlasterServerList:
 
     DEFAULT_SAT_SERVERS: ClassVar[list[str]] = []
 
-    # Server list regex for parsing server list frames
-    SERVER_LIST_REGEX: ClassVar[re.Pattern[str]] = re.compile(
-        r"^/ServerList/(?P<ServerList>.*?)(?:\\ServerList\\/SatServers/(?P<SatServers>.*?)\\SatServers\\)?$",
-    )
+    # Section markers delimiting server list frame content
+    SERVER_LIST_START: ClassVar[str] = "/ServerList/"
+    SERVER_LIST_END: ClassVar[str] = "\\ServerList\\"
+    SAT_SERVERS_START: ClassVar[str] = "/SatServers/"
+    SAT_SERVERS_END: ClassVar[str] = "\\SatServers\\"
 
     # Instance attributes
     servers: list[tuple[str, int]] = field(default_factory=list)
@@ -139,14 +150,14 @@ class ByteBlasterServerList:
         connection endpoints, providing reliable fallback options when dynamic server
         discovery fails or when initializing without explicit server configuration.
 
-        The method parses default server strings into validated (host, port) tuples,
-        ensuring all default servers meet the required format standards before adding
-        them to the active server collections.
+        The default server strings are read from DEFAULT_SERVERS and DEFAULT_SAT_SERVERS
+        on every call, so subclass and runtime overrides apply. Their parsed (host, port)
+        tuples are cached by content, and each instance receives its own copy of them.
         """
         if not self.servers:
-            self.servers = [self.parse_server(server) for server in self.DEFAULT_SERVERS]
+            self.servers = list(_parse_default_servers(tuple(self.DEFAULT_SERVERS)))
         if not self.sat_servers:
-            self.sat_servers = [self.parse_server(server) for server in self.DEFAULT_SAT_SERVERS]
+            self.sat_servers = list(_parse_default_servers(tuple(self.DEFAULT_SAT_SERVERS)))
 
     @staticmethod
     def parse_server(server_string: str) -> tuple[str, int]:
@@ -204,8 +215,9 @@ class ByteBlasterServerList:
         2. Full format: '/ServerList/servers\\ServerList\\/SatServers/satellites\\SatServers\\'
 
         For the simple format, servers are pipe-delimited and only terrestrial servers
-        are specified. For the full format, the method uses regex parsing to extract
-        both terrestrial servers (pipe-delimited) and satellite servers (plus-delimited).
+        are specified. For the full format, the method slices the content between the
+        section markers to extract both terrestrial servers (pipe-delimited) and
+        satellite servers (plus-delimited).
 
         The method includes robust error handling, logging warnings for parsing failures
         while filtering out invalid server entries to maintain service availability
@@ -221,67 +233,45 @@ class ByteBlasterServerList:
             ValueError: If content format is unrecognizable or completely unparseable.
 
         """
-        # Handle simple server list format: /ServerList/server1|server2|server3
-        if content.startswith("/ServerList/"):
-            # Extract server list part
-            server_list_part = content[12:]  # Remove "/ServerList/"
-
-            # Look for end markers and clean up
-            if "\\ServerList\\" in server_list_part:
-                server_list_part = server_list_part.split("\\ServerList\\")[0]
-
-            # Parse regular servers (separated by |)
-            servers = []
-            if server_list_part:
-                server_entries = [s.strip() for s in server_list_part.split("|") if s.strip()]
-                try:
-                    servers = [cls.parse_server(server) for server in server_entries]
-                except ValueError as e:
-                    logger.warning("Failed to parse some servers: %s", e)
-                    # Filter out invalid servers
-                    servers: list[tuple[str, int]] = []
-                    for server in server_entries:
-                        try:
-                            servers.append(cls.parse_server(server))
-                        except ValueError:
-                            logger.debug("Skipping invalid server: %s", server)
-
-            return cls(
-                servers=servers,
-                sat_servers=[],
-                received_at=datetime.now(UTC),
-            )
-
-        # Try original regex for full format
-        match = cls.SERVER_LIST_REGEX.match(content)
-        if not match:
+        if not content.startswith(cls.SERVER_LIST_START):
             msg = f"Unable to parse server list: {content[:100]}..."
             raise ValueError(msg)
 
-        # Extract server lists from regex match
-        server_list_str = match.group("ServerList")
-        sat_servers_str = (
-            match.group("SatServers") if match.lastindex and match.lastindex >= 2 else None
-        )
-
-        # Parse regular servers (separated by |)
-        servers = []
-        if server_list_str:
-            server_entries = [s.strip() for s in server_list_str.split("|") if s.strip()]
-            servers = [cls.parse_server(server) for server in server_entries]
-
-        # Parse satellite servers (separated by +)
-        sat_servers = []
-        if sat_servers_str:
-            sat_entries = [s.strip() for s in sat_servers_str.split("+") if s.strip()]
-            sat_servers = [cls.parse_server(server) for server in sat_entries]
+        # Slice out each section between its start and end markers; both the end
+        # markers and the satellite section are optional
+        server_list_str = content[len(cls.SERVER_LIST_START) :]
+        sat_servers_str = ""
+        end = server_list_str.find(cls.SERVER_LIST_END)
+        if end >= 0:
+            remainder = server_list_str[end + len(cls.SERVER_LIST_END) :]
+            server_list_str = server_list_str[:end]
+            if remainder.startswith(cls.SAT_SERVERS_START):
+                sat_servers_str = remainder[len(cls.SAT_SERVERS_START) :]
+                sat_end = sat_servers_str.find(cls.SAT_SERVERS_END)
+                if sat_end >= 0:
+                    sat_servers_str = sat_servers_str[:sat_end]
 
         return cls(
-            servers=servers,
-            sat_servers=sat_servers,
+            # Regular servers are separated by | and satellite servers by +
+            servers=cls._parse_server_entries(server_list_str, "|"),
+            sat_servers=cls._parse_server_entries(sat_servers_str, "+"),
             received_at=datetime.now(UTC),
         )
 
+    @classmethod
+    def _parse_server_entries(cls, entries: str, separator: str) -> list[tuple[str, int]]:
+        """Parse separator-delimited server entries, skipping blank and invalid ones."""
+        servers: list[tuple[str, int]] = []
+        for entry in entries.split(separator):
+            server = entry.strip()
+            if not server:
+                continue
+            try:
+                servers.append(cls.parse_server(server))
+            except ValueError as e:
+                logger.warning("Skipping invalid server: %s", e)
+        return servers
+
     def get_all_servers(self) -> list[tuple[str, int]]:
         """Retrieve unified list of all available server endpoints.
 
@@ -325,7 +315,13 @@ class ByteBlasterServerList:
         return len(self.servers) > 0 or len(self.sat_servers) > 0
 
 
-@dataclass
+@functools.lru_cache(maxsize=16)
+def _parse_default_servers(server_strings: tuple[str, ...]) -> tuple[tuple[str, int], ...]:
+    """Parse a default server list, cached by its contents."""
+    return tuple(map(ByteBlasterServerList.parse_server, server_strings))
+
+
+@dataclass(slots=True)
 class ProtocolFrame:
     """Base class for all ByteBlaster protocol frame types.
 
@@ -344,7 +340,7 @@ class ProtocolFrame:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass
+@dataclass(slots=True)
 class DataBlockFrame(ProtocolFrame):
     """Protocol frame specialized for carrying QBT data block segments.
 
@@ -362,7 +358,7 @@ class DataBlockFrame(ProtocolFrame):
     segment: QBTSegment | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerListFrame(ProtocolFrame):
     """Protocol frame specialized for carrying server configuration updates.
 
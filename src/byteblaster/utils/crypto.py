@@ -6,6 +6,10 @@ as required by the ByteBlaster protocol specification.
 
 import zlib
 
+# Translation table mapping every byte value to its XOR with 0xFF, so the
+# per-byte transform runs in C via bytes.translate().
+_XOR_TABLE = bytes(b ^ 0xFF for b in range(256))
+
 
 def xor_encode(data: bytes) -> bytes:
     """Encode bytes by XOR-ing each byte with 0xFF.
@@ -27,7 +31,7 @@ def xor_encode(data: bytes) -> bytes:
         True
 
     """
-    return bytes(b ^ 0xFF for b in data)
+    return bytes(data).translate(_XOR_TABLE)
 
 
 def xor_decode(data: bytes) -> bytes:
@@ -43,7 +47,7 @@ def xor_decode(data: bytes) -> bytes:
         Decoded bytes
 
     """
-    return bytes(b ^ 0xFF for b in data)
+    return bytes(data).translate(_XOR_TABLE)
 
 
 def xor_encode_string(text: str, encoding: str = "ascii") -> bytes:
@@ -158,10 +162,11 @@ def calculate_checksum(data: bytes) -> int:
 
 
 class XorBuffer:
-    """Buffer that automatically XOR decodes data as it's read.
+    """Buffer that accepts XOR-encoded data and serves it decoded.
 
-    This class provides a convenient way to work with XOR-encoded data streams,
-    automatically decoding data as it's consumed.
+    This class provides a convenient way to work with XOR-encoded data streams.
+    Data is decoded once as it is appended, so peeks, reads and searches all work
+    on plain bytes no matter how often the same region is examined.
     """
 
     def __init__(self, initial_data: bytes = b"") -> None:
@@ -171,17 +176,17 @@ class XorBuffer:
             initial_data: Initial XOR-encoded data to add to buffer
 
         """
-        self._buffer = bytearray(initial_data)
+        self._buffer = bytearray(initial_data).translate(_XOR_TABLE)
         self._position = 0
 
     def append(self, data: bytes) -> None:
-        """Append XOR-encoded data to buffer.
+        """Decode XOR-encoded data and append it to the buffer.
 
         Args:
             data: XOR-encoded bytes to append
 
         """
-        self._buffer.extend(data)
+        self._buffer += data.translate(_XOR_TABLE)
 
     def peek(self, size: int, offset: int = 0) -> bytes:
         """Peek at decoded data without consuming it.
@@ -195,13 +200,7 @@ class XorBuffer:
 
         """
         start = self._position + offset
-        end = min(start + size, len(self._buffer))
-
-        if start >= len(self._buffer):
-            return b""
-
-        encoded_data = bytes(self._buffer[start:end])
-        return xor_decode(encoded_data)
+        return bytes(self._buffer[start : start + size])
 
     def read(self, size: int) -> bytes:
         """Read and consume decoded data from buffer.
@@ -217,8 +216,23 @@ class XorBuffer:
         self._position += len(data)
         return data
 
+    def find(self, sub: bytes, offset: int = 0) -> int:
+        """Find a decoded byte sequence without copying the buffer.
+
+        Args:
+            sub: Decoded bytes to search for
+            offset: Offset from current position to start searching
+
+        Returns:
+            Offset of the first match relative to the current position, or -1 if
+            the sequence is not in the buffer
+
+        """
+        index = self._buffer.find(sub, self._position + offset)
+        return index - self._position if index >= 0 else -1
+
     def skip(self, size: int) -> int:
-        """Skip bytes in buffer without decoding.
+        """Skip bytes in buffer without copying them.
 
         Args:
             size: Number of bytes to skip
@@ -232,6 +246,26 @@ class XorBuffer:
         self._position += to_skip
         return to_skip
 
+    def skip_leading(self, chars: bytes) -> int:
+        """Skip bytes at the current position while their value is in chars.
+
+        Args:
+            chars: Decoded byte values to skip
+
+        Returns:
+            Number of bytes skipped
+
+        """
+        # Walk the buffer in place; the skipped run is short, and slicing the
+        # remainder would copy the whole buffer on every call.
+        buffer = self._buffer
+        start = position = self._position
+        end = len(buffer)
+        while position < end and buffer[position] in chars:
+            position += 1
+        self._position = position
+        return position - start
+
     def available(self) -> int:
         """Get number of bytes available to read."""
         return len(self._buffer) - self._position
@@ -47,6 +47,8 @@ class ServerListManager:
         self._enable_persistence = enable_persistence
         self._current_index = 0
         self._server_list = self._load_server_list()
+        # Flattened connection order, rebuilt only when the server list is replaced
+        self._all_servers = tuple(self._server_list.get_all_servers())
 
     def _load_server_list(self) -> ByteBlasterServerList:
         """Load server list from persistence or use defaults.
@@ -186,6 +188,7 @@ class ServerListManager:
             temp_path.replace(self._persist_path)
 
             self._server_list = server_list
+            self._all_servers = tuple(server_list.get_all_servers())
             self._current_index = 0  # Reset index when list changes
 
             logger.info("Saved %d servers to %s", len(server_list), self._persist_path)
@@ -200,7 +203,7 @@ class ServerListManager:
             Tuple of (host, port) or None if no servers available
 
         """
-        all_servers = self._server_list.get_all_servers()
+        all_servers = self._all_servers
         if not all_servers:
             logger.warning("No servers available")
             return None
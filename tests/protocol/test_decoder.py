@@ -7,6 +7,8 @@ handling, and edge cases in the ByteBlaster protocol implementation.
 """
 
 import re
+import time
+import zlib
 from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
@@ -14,6 +16,7 @@ import pytest
 
 from byteblaster.protocol.decoder import DecoderState, ProtocolDecoder
 from byteblaster.protocol.models import (
+    FILLFILE_NAME,
     ByteBlasterServerList,
     DataBlockFrame,
     QBTSegment,
@@ -112,6 +115,20 @@ class TestProtocolDecoder:
         assert decoder._state == DecoderState.RESYNC
         assert decoder._buffer.available() == 0
 
+    def test_feed_when_frames_consumed_then_releases_consumed_bytes(self) -> None:
+        """Test that feed only keeps unconsumed bytes buffered between reads."""
+        decoder = ProtocolDecoder(Mock())
+        frame = b"\x00" * 6 + b"/ServerList/a:1|b:2\x00"
+        partial = b"\x00" * 6 + b"/ServerList/c:3"
+
+        for _ in range(3):
+            decoder.feed(xor_encode(frame))
+        decoder.feed(xor_encode(partial))
+
+        assert decoder._buffer._position == 0
+        assert len(decoder._buffer._buffer) == decoder._buffer.available()
+        assert decoder._buffer.available() == len(b"/ServerList/c:3")
+
     def test_feed_when_insufficient_sync_data_then_remains_in_resync(self) -> None:
         """Test that insufficient sync data keeps decoder in RESYNC state."""
         decoder = ProtocolDecoder()
@@ -192,29 +209,25 @@ class TestProtocolDecoder:
 
         assert decoder._state == DecoderState.RESYNC
 
-    def test_is_data_block_header_when_valid_header_then_returns_true(self) -> None:
-        """Test data block header detection with valid headers."""
-        assert ProtocolDecoder._is_data_block_header(b"/PF") is True
-        assert ProtocolDecoder._is_data_block_header(b"/PFtest.txt") is True
-
-    def test_is_data_block_header_when_invalid_header_then_returns_false(self) -> None:
-        """Test data block header detection with invalid headers."""
-        assert ProtocolDecoder._is_data_block_header(b"/Se") is False
-        assert ProtocolDecoder._is_data_block_header(b"PF") is False
-        assert ProtocolDecoder._is_data_block_header(b"/P") is False
-        assert ProtocolDecoder._is_data_block_header(b"") is False
-
-    def test_is_server_list_header_when_valid_header_then_returns_true(self) -> None:
-        """Test server list header detection with valid headers."""
-        assert ProtocolDecoder._is_server_list_header(b"/Se") is True
-        assert ProtocolDecoder._is_server_list_header(b"/ServerList") is True
-
-    def test_is_server_list_header_when_invalid_header_then_returns_false(self) -> None:
-        """Test server list header detection with invalid headers."""
-        assert ProtocolDecoder._is_server_list_header(b"/PF") is False
-        assert ProtocolDecoder._is_server_list_header(b"Se") is False
-        assert ProtocolDecoder._is_server_list_header(b"/S") is False
-        assert ProtocolDecoder._is_server_list_header(b"") is False
+    @pytest.mark.parametrize(
+        ("header", "expected_state"),
+        [
+            (b"/PFtest.txt /PN 1", DecoderState.BLOCK_HEADER),
+            (b"/ServerList/a:1|b:2", DecoderState.SERVER_LIST),
+            (b"PF/test.txt /PN 1", DecoderState.RESYNC),
+            (b"/Sx/ServerList/", DecoderState.RESYNC),
+        ],
+    )
+    def test_determine_frame_type_when_prefix_checked_then_selects_state(
+        self, header: bytes, expected_state: DecoderState
+    ) -> None:
+        """Test frame type selection by the three-byte header prefix."""
+        decoder = ProtocolDecoder()
+        decoder._state = DecoderState.FRAME_TYPE
+        decoder._buffer.append(xor_encode(header))
+
+        assert decoder._determine_frame_type() is True
+        assert decoder._state == expected_state
 
     def test_process_server_list_when_null_terminated_then_processes_correctly(
         self,
@@ -235,6 +248,41 @@ class TestProtocolDecoder:
         frame = handler.call_args[0][0]
         assert isinstance(frame, ServerListFrame)
 
+    def test_process_server_list_when_terminator_missing_then_waits_for_more_data(
+        self,
+    ) -> None:
+        """Test a server list without its null terminator stays buffered."""
+        decoder = ProtocolDecoder()
+        handler = Mock()
+        decoder.set_frame_handler(handler)
+        decoder._state = DecoderState.SERVER_LIST
+
+        server_content = b"/ServerList/192.168.1.1:8080\\ServerList\\"
+        decoder.feed(xor_encode(server_content))
+
+        assert decoder._state == DecoderState.SERVER_LIST
+        assert decoder._buffer.available() == len(server_content)
+        handler.assert_not_called()
+
+        decoder.feed(xor_encode(b"\x00"))
+
+        assert decoder._state == DecoderState.START_FRAME
+        handler.assert_called_once()
+
+    def test_process_server_list_when_terminator_never_arrives_then_raises_error(
+        self,
+    ) -> None:
+        """Test an unterminated server list is rejected once it exceeds the size cap."""
+        decoder = ProtocolDecoder()
+        decoder._state = DecoderState.SERVER_LIST
+
+        prefix = b"/ServerList/"
+        decoder.feed(xor_encode(prefix.ljust(ProtocolDecoder.MAX_SERVER_LIST_SIZE, b"a")))
+        assert decoder._state == DecoderState.SERVER_LIST
+
+        with pytest.raises(ValueError, match="without terminator"):
+            decoder.feed(xor_encode(b"a"))
+
     def test_process_server_list_when_end_pattern_present_then_processes_correctly(
         self,
     ) -> None:
@@ -322,6 +370,7 @@ class TestProtocolDecoder:
         assert segment.version == 2  # Has /DL parameter
         assert segment.source == "192.168.1.1:8080"
         assert segment.header == header_str
+        assert segment.received_at is mock_now
 
     def test_parse_header_groups_when_no_dl_parameter_then_v1_protocol(self) -> None:
         """Test that headers without /DL parameter are parsed as V1 protocol."""
@@ -337,6 +386,82 @@ class TestProtocolDecoder:
         assert segment.version == 1
         assert segment.length == 1024  # V1 default
 
+    def test_parse_header_groups_when_fillfile_then_filename_is_interned(self) -> None:
+        """Test that parsed filenames are interned so filler checks hit the identity path."""
+        decoder = ProtocolDecoder()
+
+        header_content = "/PFFILLFILE.TXT /PN 1 /PT 1 /CS 0 /FD12/25/2023 10:30:00 AM"
+        header_str = header_content.ljust(78, " ") + "\r\n"
+        match = decoder.HEADER_REGEX.match(header_str.encode("ascii"))
+        assert match is not None
+
+        segment = decoder._parse_header_groups(match, header_str)
+
+        assert segment.filename is FILLFILE_NAME
+
+    def test_parse_header_groups_when_date_repeats_then_reuses_parsed_timestamp(self) -> None:
+        """Test consecutive headers with the same /FD field parse the date once."""
+        decoder = ProtocolDecoder()
+        matches = []
+        for header_content in (
+            "/PFtest.txt /PN 1 /PT 2 /CS 1 /FD12/25/2023 10:30:00 AM",
+            "/PFtest.txt /PN 2 /PT 2 /CS 2 /FD12/25/2023 10:30:00 AM",
+            "/PFnext.txt /PN 1 /PT 1 /CS 3 /FD12/25/2023 10:31:00 AM",
+        ):
+            header_str = header_content.ljust(78, " ") + "\r\n"
+            match = decoder.HEADER_REGEX.match(header_str.encode("ascii"))
+            assert match is not None
+            matches.append((match, header_str))
+
+        with patch.object(
+            ProtocolDecoder, "_parse_header_date", wraps=ProtocolDecoder._parse_header_date
+        ) as mock_parse:
+            segments = [decoder._parse_header_groups(m, h) for m, h in matches]
+
+        assert mock_parse.call_count == 2
+        assert segments[0].timestamp == segments[1].timestamp
+        assert segments[2].timestamp == datetime(2023, 12, 25, 10, 31).astimezone(UTC)
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "12/25/2023 10:30:00 AM",
+            "12/25/2023 10:30:00 PM",
+            "01/01/2024 12:00:05 AM",
+            "01/01/2024 12:59:59 PM",
+            "1/5/2024 9:07:03 PM",
+        ],
+    )
+    def test_parse_header_date_when_valid_then_matches_strptime_in_utc(self, date_str: str) -> None:
+        """Test the fast header date parser agrees with strptime read as local time."""
+        expected = datetime.strptime(date_str, ProtocolDecoder.HEADER_DATE_FORMAT).astimezone(UTC)
+
+        result = ProtocolDecoder._parse_header_date(date_str)
+
+        assert result == expected
+        assert result.tzinfo is UTC
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+    def test_parse_header_date_when_host_not_utc_then_converts_local_time(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test header dates are read as host local time, as strptime().astimezone() did."""
+        monkeypatch.setenv("TZ", "EST+05")
+        time.tzset()
+        try:
+            result = ProtocolDecoder._parse_header_date("12/25/2023 10:30:00 AM")
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert result == datetime(2023, 12, 25, 15, 30, tzinfo=UTC)
+
+    @pytest.mark.parametrize("date_str", ["13/45/2023 10:30:00 AM", "12/25/2023 13:30:00 PM", ""])
+    def test_parse_header_date_when_invalid_then_raises_value_error(self, date_str: str) -> None:
+        """Test invalid header dates still raise ValueError."""
+        with pytest.raises(ValueError):  # noqa: PT011
+            ProtocolDecoder._parse_header_date(date_str)
+
     def test_process_block_body_when_v1_protocol_then_reads_fixed_size(self) -> None:
         """Test that V1 protocol reads fixed 1024-byte blocks."""
         decoder = ProtocolDecoder()
@@ -468,6 +593,24 @@ class TestProtocolDecoder:
         frame = handler.call_args[0][0]
         assert frame.content == b"test content"
 
+    def test_validate_segment_when_binary_file_then_preserves_padding(self) -> None:
+        """Test that trailing null bytes in non-text files are left intact."""
+        decoder = ProtocolDecoder()
+        handler = Mock()
+        decoder.set_frame_handler(handler)
+        decoder._current_segment = QBTSegment(
+            filename="image.gif",
+            block_number=1,
+            total_blocks=1,
+            content=b"GIF89a\x00\x00\x00 \r\n",
+        )
+
+        with patch.object(decoder, "_validate_segment_checksum", return_value=True):
+            decoder._validate_segment()
+
+        frame = handler.call_args[0][0]
+        assert frame.content == b"GIF89a\x00\x00\x00 \r\n"
+
     def test_validate_segment_checksum_when_v1_protocol_then_calls_v1_validation(
         self,
     ) -> None:
@@ -534,112 +677,36 @@ class TestProtocolDecoder:
 
         assert result is False
 
-    def test_validate_v2_checksum_when_compressed_data_then_validates_compressed(
-        self,
-    ) -> None:
-        """Test V2 checksum validation with compressed data."""
-        decoder = ProtocolDecoder()
-        segment = QBTSegment(content=b"compressed_data")
-
-        with (
-            patch.object(decoder, "_is_compressed_data", return_value=True),
-            patch.object(decoder, "_validate_compressed_data", return_value=True) as mock_validate,
-        ):
-            result = decoder._validate_v2_checksum(segment)
-
-        assert result is True
-        mock_validate.assert_called_once_with(segment)
-
-    def test_validate_v2_checksum_when_uncompressed_data_then_validates_uncompressed(
-        self,
-    ) -> None:
-        """Test V2 checksum validation with uncompressed data."""
-        decoder = ProtocolDecoder()
-        segment = QBTSegment(content=b"uncompressed_data")
-
-        with (
-            patch.object(decoder, "_is_compressed_data", return_value=False),
-            patch.object(
-                decoder, "_validate_uncompressed_v2_data", return_value=True
-            ) as mock_validate,
-        ):
-            result = decoder._validate_v2_checksum(segment)
-
-        assert result is True
-        mock_validate.assert_called_once_with(segment)
-
-    def test_is_compressed_data_when_zlib_header_then_returns_true(self) -> None:
-        """Test compressed data detection with valid zlib headers."""
-        decoder = ProtocolDecoder()
-
-        # Common zlib headers
-        assert decoder._is_compressed_data(b"\x78\x9c") is True  # Default compression
-        assert decoder._is_compressed_data(b"\x78\x01") is True  # No compression
-        assert decoder._is_compressed_data(b"\x78\xda") is True  # Best compression
-
-    def test_is_compressed_data_when_no_zlib_header_then_returns_false(self) -> None:
-        """Test compressed data detection with non-zlib data."""
-        decoder = ProtocolDecoder()
-
-        assert decoder._is_compressed_data(b"text data") is False
-        assert decoder._is_compressed_data(b"\x00\x00") is False
-        assert decoder._is_compressed_data(b"") is False
-
-    @patch("zlib.decompress")
     @patch("byteblaster.protocol.decoder.verify_checksum")
-    def test_validate_compressed_data_when_valid_then_returns_true(
-        self, mock_verify: Mock, mock_decompress: Mock
-    ) -> None:
-        """Test compressed data validation with valid data."""
-        mock_decompress.return_value = b"decompressed content"
+    def test_validate_v2_checksum_when_valid_then_returns_true(self, mock_verify: Mock) -> None:
+        """Test V2 validation checks the already decompressed content."""
         mock_verify.return_value = True
 
         decoder = ProtocolDecoder()
         segment = QBTSegment(
-            content=b"\x78\x9ccompressed",
+            content=b"uncompressed content",
             checksum=12345,
         )
 
-        result = decoder._validate_compressed_data(segment)
+        result = decoder._validate_v2_checksum(segment)
 
         assert result is True
-        mock_decompress.assert_called_once_with(b"\x78\x9ccompressed")
-        mock_verify.assert_called_once_with(b"decompressed content", 12345)
+        mock_verify.assert_called_once_with(b"uncompressed content", 12345)
 
-    @patch("zlib.decompress")
-    @patch("byteblaster.protocol.decoder.verify_checksum")
-    def test_validate_compressed_data_when_decompression_fails_then_returns_false(
-        self, mock_verify: Mock, mock_decompress: Mock
+    def test_validate_v2_checksum_when_content_has_zlib_header_then_does_not_inflate_again(
+        self,
     ) -> None:
-        """Test compressed data validation when decompression fails."""
-        mock_decompress.side_effect = OSError("Decompression failed")
-        mock_verify.return_value = False
-
+        """Test V2 validation never decompresses content a second time."""
+        content = zlib.compress(b"payload")
         decoder = ProtocolDecoder()
-        segment = QBTSegment(content=b"invalid_compressed_data")
-
-        result = decoder._validate_compressed_data(segment)
-
-        assert result is False
-        mock_verify.assert_called_once_with(b"invalid_compressed_data", 0)
+        segment = QBTSegment(content=content, checksum=sum(content) & 0xFFFF)
 
-    @patch("byteblaster.protocol.decoder.verify_checksum")
-    def test_validate_uncompressed_v2_data_when_valid_then_returns_true(
-        self, mock_verify: Mock
-    ) -> None:
-        """Test uncompressed V2 data validation with valid checksum."""
-        mock_verify.return_value = True
-
-        decoder = ProtocolDecoder()
-        segment = QBTSegment(
-            content=b"uncompressed content",
-            checksum=12345,
-        )
-
-        result = decoder._validate_uncompressed_v2_data(segment)
+        with patch("zlib.decompress") as mock_decompress:
+            result = decoder._validate_v2_checksum(segment)
 
         assert result is True
-        mock_verify.assert_called_once_with(b"uncompressed content", 12345)
+        assert segment.content == content
+        mock_decompress.assert_not_called()
 
     def test_read_null_terminated_string_when_null_found_then_returns_string(
         self,
@@ -747,6 +814,28 @@ class TestProtocolDecoderIntegration:
         assert frame.segment.version == 1
         assert frame.content.startswith(b"test content")
 
+    def test_feed_when_many_frames_in_one_read_then_emits_all(self) -> None:
+        """Test that one large read holding many frames is decoded completely."""
+        decoder = ProtocolDecoder()
+        handler = Mock()
+        decoder.set_frame_handler(handler)
+
+        frame_count = 2000
+        frames = b"".join(
+            b"\x00" * 6
+            + (
+                f"/PFfile{index}.bin /PN 1 /PT 1 /CS 0 /FD12/25/2023 10:30:00 AM".ljust(78) + "\r\n"
+            ).encode("ascii")
+            + bytes(1024)
+            for index in range(frame_count)
+        )
+
+        decoder.feed(xor_encode(frames))
+
+        assert handler.call_count == frame_count
+        assert handler.call_args[0][0].segment.filename == f"file{frame_count - 1}.bin"
+        assert decoder._buffer.available() == 0
+
     def test_complete_v2_data_block_processing(self) -> None:
         """Test complete processing of a V2 data block with compression."""
         decoder = ProtocolDecoder()
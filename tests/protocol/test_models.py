@@ -85,7 +85,7 @@ class TestQBTSegment:
             filename="Weather_Alert.TXT",
             timestamp=test_timestamp,
         )
-        expected_key = "weather_alert.txt_2024-01-15t12:00:00+00:00"
+        expected_key = "weather_alert.txt_1705320000"
 
         # Act
         key = segment.key
@@ -98,7 +98,7 @@ class TestQBTSegment:
         # Arrange
         test_timestamp = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         segment = QBTSegment(filename="", timestamp=test_timestamp)
-        expected_key = "_2024-01-15t12:00:00+00:00"
+        expected_key = "_1705320000"
 
         # Act
         key = segment.key
@@ -167,6 +167,33 @@ class TestByteBlasterServerList:
         expected_first_server = ("emwin.weathermessage.com", 2211)
         assert server_list.servers[0] == expected_first_server
 
+    def test_server_list_when_subclass_overrides_defaults_then_uses_overridden_servers(self):
+        """Test default servers are taken from the class the instance is created from."""
+
+        # Arrange
+        class CustomServerList(ByteBlasterServerList):
+            DEFAULT_SERVERS = ["custom.example.com:2211"]  # noqa: RUF012
+            DEFAULT_SAT_SERVERS = ["sat.example.com:1000"]  # noqa: RUF012
+
+        # Act
+        server_list = CustomServerList()
+        base_list = ByteBlasterServerList()
+
+        # Assert
+        assert server_list.servers == [("custom.example.com", 2211)]
+        assert server_list.sat_servers == [("sat.example.com", 1000)]
+        assert base_list.servers[0] == ("emwin.weathermessage.com", 2211)
+
+    def test_server_list_when_defaults_changed_at_runtime_then_uses_new_defaults(self):
+        """Test runtime changes to DEFAULT_SERVERS apply to later instances."""
+        # Arrange
+        with patch.object(ByteBlasterServerList, "DEFAULT_SERVERS", ["runtime.example.com:80"]):
+            # Act
+            server_list = ByteBlasterServerList()
+
+        # Assert
+        assert server_list.servers == [("runtime.example.com", 80)]
+
     def test_server_list_when_custom_servers_provided_then_uses_custom_servers(self):
         """Test server list uses provided servers instead of defaults."""
         # Arrange
@@ -281,6 +308,21 @@ class TestByteBlasterServerList:
         assert server_list.servers[1] == ("server2.com", 2211)
         assert len(server_list.sat_servers) == 0
 
+    def test_from_server_list_frame_when_full_format_then_parses_sat_servers(self):
+        """Test parsing full server list format with satellite servers."""
+        # Arrange
+        content = (
+            "/ServerList/server1.com:2211|server2.com:1000\\ServerList\\"
+            "/SatServers/sat1.com:2211+sat2.com:1000\\SatServers\\"
+        )
+
+        # Act
+        server_list = ByteBlasterServerList.from_server_list_frame(content)
+
+        # Assert
+        assert server_list.servers == [("server1.com", 2211), ("server2.com", 1000)]
+        assert server_list.sat_servers == [("sat1.com", 2211), ("sat2.com", 1000)]
+
     def test_from_server_list_frame_when_empty_server_list_then_uses_defaults(self):
         """Test parsing server list frame with empty server list uses defaults via __post_init__."""
         # Arrange
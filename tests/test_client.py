@@ -10,6 +10,7 @@ proper mocking and async test patterns.
 import asyncio
 import logging
 import time
+import zlib
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,7 +23,7 @@ from byteblaster.client import (
     SegmentStream,
     Watchdog,
 )
-from byteblaster.protocol.models import QBTSegment
+from byteblaster.protocol.models import DataBlockFrame, QBTSegment
 
 
 class TestSegmentStream:
@@ -84,6 +85,36 @@ class TestSegmentStream:
             segment = await stream.__anext__()
             assert segment is test_segment
 
+    @pytest.mark.asyncio
+    async def test_segment_stream_when_batching_then_drains_queued_segments(
+        self, segment_stream: SegmentStream
+    ) -> None:
+        """Test SegmentStream batches split queued segments by max batch size."""
+        test_segments = [
+            QBTSegment(filename=f"test{i}.txt", block_number=1, total_blocks=1) for i in range(5)
+        ]
+
+        async with segment_stream as stream:
+            for test_segment in test_segments:
+                await stream._enqueue_segment(test_segment)
+            batches = stream.batches(max_batch_size=3)
+            assert await anext(batches) == test_segments[:3]
+            assert await anext(batches) == test_segments[3:]
+
+    @pytest.mark.asyncio
+    async def test_segment_stream_when_batching_to_end_marker_then_yields_final_batch(
+        self, segment_stream: SegmentStream
+    ) -> None:
+        """Test SegmentStream batches stop at the end-of-stream marker."""
+        test_segment = QBTSegment(filename="test.txt", block_number=1, total_blocks=1)
+
+        async with segment_stream as stream:
+            await stream._enqueue_segment(test_segment)
+            stream._queue.put_nowait(None)
+
+            batches = [batch async for batch in stream.batches()]
+            assert batches == [[test_segment]]
+
     @pytest.mark.asyncio
     async def test_segment_stream_when_closed_then_raises_stop_iteration(
         self, segment_stream: SegmentStream
@@ -228,6 +259,28 @@ class TestConnectionProtocol:
 
         mock_client.on_protocol_error.assert_called_once_with(test_exception)
 
+    def test_data_received_when_decompression_fails_then_handles_error(
+        self, protocol: ConnectionProtocol, mock_client: MagicMock
+    ) -> None:
+        """Test data_received treats zlib errors from the decoder as protocol errors."""
+        test_exception = zlib.error("Bad compressed block")
+        mock_client.decoder.feed.side_effect = test_exception
+
+        protocol.data_received(b"bad data")
+
+        mock_client.on_protocol_error.assert_called_once_with(test_exception)
+
+    def test_data_received_when_frame_callback_fails_then_handles_error(
+        self, protocol: ConnectionProtocol, mock_client: MagicMock
+    ) -> None:
+        """Test data_received reports errors raised by the frame callback chain."""
+        test_exception = TypeError("Bad server list")
+        mock_client.decoder.feed.side_effect = test_exception
+
+        protocol.data_received(b"data")
+
+        mock_client.on_protocol_error.assert_called_once_with(test_exception)
+
     @pytest.mark.asyncio
     async def test_send_data_when_connected_then_writes_to_transport(
         self, protocol: ConnectionProtocol
@@ -508,6 +561,8 @@ class TestByteBlasterClient:
         """Test ByteBlasterClient initialization sets correct configuration."""
         assert client._email == client_options.email
         assert client._reconnect_delay == client_options.reconnect_delay
+        assert client._backoff_delay == client_options.reconnect_delay * 4
+        assert client._failover_delay == client_options.reconnect_delay
         assert client._connection_timeout == client_options.connection_timeout
         assert not client._running
         assert not client._connected
@@ -649,21 +704,126 @@ class TestByteBlasterClient:
 
         assert client.decoder_state == "CONNECTED"
 
-    def test_byte_blaster_client_when_on_frame_received_with_data_segment_then_handles_async(
+    def test_byte_blaster_client_when_on_frame_received_with_data_segment_then_queues_segment(
         self, client: ByteBlasterClient
     ) -> None:
-        """Test on_frame_received creates task for data segment handling."""
-        from byteblaster.protocol.models import DataBlockFrame
-
-        frame = DataBlockFrame(
-            content=b"test data",
-            segment=QBTSegment(filename="test.txt", block_number=1, total_blocks=1),
-        )
+        """Test on_frame_received queues data segments for the segment worker."""
+        segment = QBTSegment(filename="test.txt", block_number=1, total_blocks=1)
+        frame = DataBlockFrame(content=b"test data", segment=segment)
 
         with patch("asyncio.create_task") as mock_create_task:
             client.on_frame_received(frame)
 
-            mock_create_task.assert_called_once()
+            mock_create_task.assert_not_called()
+
+        assert client._segment_queue.get_nowait() is segment
+
+    @pytest.mark.asyncio
+    async def test_byte_blaster_client_when_started_then_worker_dispatches_in_order(
+        self, client: ByteBlasterClient
+    ) -> None:
+        """Test the segment worker hands queued segments to handlers in arrival order."""
+        received: list[int] = []
+
+        async def handler(segment: QBTSegment) -> None:
+            received.append(segment.block_number)
+
+        client.subscribe(handler)
+        with patch.object(client, "_connection_loop", new_callable=AsyncMock):
+            await client.start()
+            for block_number in (1, 2, 3):
+                segment = QBTSegment(filename="test.txt", block_number=block_number, total_blocks=3)
+                client.on_frame_received(DataBlockFrame(content=b"", segment=segment))
+            await client._segment_queue.join()
+            await client.stop()
+
+        assert received == [1, 2, 3]
+        assert client._segment_worker is None
+
+    @pytest.mark.asyncio
+    async def test_byte_blaster_client_when_stopped_then_waits_for_queued_segments(
+        self, client: ByteBlasterClient
+    ) -> None:
+        """Test stop lets the segment worker finish segments already queued."""
+        received: list[int] = []
+
+        async def handler(segment: QBTSegment) -> None:
+            await asyncio.sleep(0.01)
+            received.append(segment.block_number)
+
+        client.subscribe(handler)
+        with patch.object(client, "_connection_loop", new_callable=AsyncMock):
+            await client.start()
+            for block_number in (1, 2):
+                segment = QBTSegment(filename="test.txt", block_number=block_number, total_blocks=2)
+                client.on_frame_received(DataBlockFrame(content=b"", segment=segment))
+            await client.stop()
+
+        assert received == [1, 2]
+        assert client._segment_worker is None
+
+    @pytest.mark.asyncio
+    async def test_byte_blaster_client_when_handler_is_slow_then_worker_keeps_dispatching(
+        self, client: ByteBlasterClient
+    ) -> None:
+        """Test a slow async handler does not hold up other handlers or later segments."""
+        release = asyncio.Event()
+        fast_received: list[int] = []
+
+        async def slow_handler(_segment: QBTSegment) -> None:
+            await release.wait()
+
+        async def fast_handler(segment: QBTSegment) -> None:
+            fast_received.append(segment.block_number)
+
+        client.subscribe(slow_handler)
+        client.subscribe(fast_handler)
+        with patch.object(client, "_connection_loop", new_callable=AsyncMock):
+            await client.start()
+            for block_number in (1, 2, 3):
+                segment = QBTSegment(filename="test.txt", block_number=block_number, total_blocks=3)
+                client.on_frame_received(DataBlockFrame(content=b"", segment=segment))
+            await client._segment_queue.join()
+            await asyncio.sleep(0)
+
+            assert fast_received == [1, 2, 3]
+            assert len(client._handler_tasks) == 3
+
+            release.set()
+            await client.stop()
+
+        assert not client._handler_tasks
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shutdown_timeout", [0, 0.01])
+    async def test_byte_blaster_client_when_stop_times_out_then_cancels_running_handlers(
+        self,
+        client: ByteBlasterClient,
+        caplog: pytest.LogCaptureFixture,
+        shutdown_timeout: float,
+    ) -> None:
+        """Test stop cancels stuck handlers once the timeout expires, including zero."""
+        release = asyncio.Event()
+        received: list[int] = []
+
+        async def handler(segment: QBTSegment) -> None:
+            await release.wait()
+            received.append(segment.block_number)
+
+        client.subscribe(handler)
+        with patch.object(client, "_connection_loop", new_callable=AsyncMock):
+            await client.start()
+            for block_number in (1, 2):
+                segment = QBTSegment(filename="test.txt", block_number=block_number, total_blocks=2)
+                client.on_frame_received(DataBlockFrame(content=b"", segment=segment))
+            with caplog.at_level(logging.WARNING):
+                await asyncio.wait_for(client.stop(shutdown_timeout=shutdown_timeout), timeout=1.0)
+
+        assert received == []
+        assert client._segment_worker is None
+        assert client._segment_queue.empty()
+        assert not client._handler_tasks
+        assert "did not finish within shutdown timeout" in caplog.text
 
     def test_byte_blaster_client_when_on_frame_received_with_server_list_then_updates_list(
         self, client: ByteBlasterClient
@@ -701,7 +861,8 @@ class TestByteBlasterClient:
 
         test_segment = QBTSegment(filename="test.txt", block_number=1, total_blocks=1)
 
-        await client._handle_data_segment(test_segment)
+        client._handle_data_segment(test_segment)
+        await client._wait_for_segment_handlers()
 
         sync_handler.assert_called_once_with(test_segment)
         async_handler.assert_called_once_with(test_segment)
@@ -720,7 +881,7 @@ class TestByteBlasterClient:
         test_segment = QBTSegment(filename="test.txt", block_number=1, total_blocks=1)
 
         with caplog.at_level(logging.ERROR):
-            await client._handle_data_segment(test_segment)
+            client._handle_data_segment(test_segment)
 
         # Both handlers should be called despite the first one failing
         failing_handler.assert_called_once_with(test_segment)
@@ -761,11 +922,25 @@ class TestByteBlasterClient:
     ) -> None:
         """Test on_connection_lost updates connection state."""
         client._connected = True
+        client._connection_lost = asyncio.get_running_loop().create_future()
 
         await client.on_connection_lost(None)
 
         assert not client._connected
-        client._connection_lost_event.is_set()
+        assert client._connection_lost.done()
+
+    @pytest.mark.asyncio
+    async def test_byte_blaster_client_when_connection_lost_twice_then_does_not_raise(
+        self, client: ByteBlasterClient
+    ) -> None:
+        """Test on_connection_lost tolerates an already resolved or missing future."""
+        await client.on_connection_lost(None)
+
+        client._connection_lost = asyncio.get_running_loop().create_future()
+        await client.on_connection_lost(None)
+        await client.on_connection_lost(None)
+
+        assert client._connection_lost.done()
 
     @pytest.mark.asyncio
     async def test_byte_blaster_client_when_close_connection_then_cleans_up_resources(
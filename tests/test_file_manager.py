@@ -22,7 +22,7 @@ from byteblaster.file_manager import (
     FileAssembler,
     FileStream,
 )
-from byteblaster.protocol import QBTSegment
+from byteblaster.protocol import MAX_TOTAL_BLOCKS, QBTSegment
 
 
 class TestCompletedFile:
@@ -275,6 +275,60 @@ class TestFileAssembler:
         completed_file = completion_handler.call_args[0][0]
         assert completed_file.data == b"block1block2"  # Original content, not duplicate
 
+    @pytest.mark.asyncio
+    async def test_duplicate_empty_segment_handling(
+        self, file_assembler: FileAssembler, completion_handler: AsyncMock
+    ) -> None:
+        """Test that a repeated empty block is still detected as a duplicate."""
+        timestamp = datetime.now(UTC)
+        segment1 = self.create_test_segment("empty_dup.txt", 1, 2, b"", timestamp)
+        segment1_dup = self.create_test_segment("empty_dup.txt", 1, 2, b"", timestamp)
+
+        await file_assembler.handle_segment(segment1)
+        await file_assembler.handle_segment(segment1_dup)
+
+        completion_handler.assert_not_called()
+        pending = file_assembler.file_segments[segment1.key]
+        assert pending.blocks == [b"", b""]
+        assert pending.received_mask == 0b01
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_segment_handling(
+        self,
+        file_assembler: FileAssembler,
+        completion_handler: AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a block number beyond the file's block count is ignored."""
+        timestamp = datetime.now(UTC)
+        segment1 = self.create_test_segment("range.txt", 1, 2, b"block1", timestamp)
+        stray = self.create_test_segment("range.txt", 3, 2, b"stray", timestamp)
+
+        await file_assembler.handle_segment(segment1)
+        with caplog.at_level(logging.WARNING):
+            await file_assembler.handle_segment(stray)
+
+        completion_handler.assert_not_called()
+        assert "Skipping out of range segment" in caplog.text
+        assert file_assembler.file_segments[segment1.key].blocks == [b"block1", b""]
+
+    @pytest.mark.asyncio
+    async def test_excessive_block_count_handling(
+        self,
+        file_assembler: FileAssembler,
+        completion_handler: AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a block count above MAX_TOTAL_BLOCKS is rejected before allocation."""
+        segment = self.create_test_segment("huge.txt", 1, MAX_TOTAL_BLOCKS + 1, b"block1")
+
+        with caplog.at_level(logging.WARNING):
+            await file_assembler.handle_segment(segment)
+
+        completion_handler.assert_not_called()
+        assert "Skipping segment with invalid block count" in caplog.text
+        assert segment.key not in file_assembler.file_segments
+
     @pytest.mark.asyncio
     async def test_fillfile_filtering(
         self, file_assembler: FileAssembler, completion_handler: AsyncMock
@@ -469,6 +523,24 @@ class TestByteBlasterFileManager:
         file_manager.unsubscribe(handler)
         assert handler not in file_manager._file_handlers
 
+    @pytest.mark.asyncio
+    async def test_file_dispatch_after_unsubscribe(
+        self, file_manager: ByteBlasterFileManager
+    ) -> None:
+        """Test that unsubscribed handlers no longer receive completed files."""
+        kept_handler = AsyncMock()
+        removed_handler = AsyncMock()
+
+        file_manager.subscribe(kept_handler)
+        file_manager.subscribe(removed_handler)
+        file_manager.unsubscribe(removed_handler)
+
+        test_file = CompletedFile("test.txt", b"content")
+        await file_manager._dispatch_file(test_file)
+
+        kept_handler.assert_called_once_with(test_file)
+        removed_handler.assert_not_called()
+
     def test_handler_unsubscription_not_found(
         self, file_manager: ByteBlasterFileManager, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -562,6 +634,25 @@ class TestByteBlasterFileManager:
         # Fast handler should complete before slow handler
         assert execution_order.index("fast") < execution_order.index("slow_end")
 
+    @pytest.mark.asyncio
+    async def test_sync_completing_handlers_run_eagerly(
+        self, file_manager: ByteBlasterFileManager
+    ) -> None:
+        """Test that handlers which never suspend are run without being scheduled."""
+        calls: list[str] = []
+
+        async def sync_handler(file: CompletedFile) -> None:
+            calls.append(file.filename)
+
+        file_manager.subscribe(sync_handler)
+
+        test_file = CompletedFile("test.txt", b"content")
+        dispatch = file_manager._dispatch_file(test_file)
+        with pytest.raises(StopIteration):
+            dispatch.send(None)
+
+        assert calls == ["test.txt"]
+
     def test_stream_files_creation(self, file_manager: ByteBlasterFileManager) -> None:
         """Test creation of FileStream."""
         stream = file_manager.stream_files(max_queue_size=50)
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from byteblaster.handler import WeatherDataHandler
-from byteblaster.protocol.models import QBTSegment
+from byteblaster.protocol.models import MAX_TOTAL_BLOCKS, QBTSegment
 
 
 class TestWeatherDataHandlerInit:
@@ -100,8 +100,8 @@ class TestWeatherDataHandlerHandleSegment:
 
         file_key = sample_segment.key
         assert file_key in handler.file_segments
-        assert len(handler.file_segments[file_key]) == 1
-        assert handler.file_segments[file_key][0] == sample_segment
+        assert len(handler.file_segments[file_key]) == sample_segment.total_blocks
+        assert handler.file_segments[file_key] == [sample_segment, None, None]
 
     @pytest.mark.asyncio
     async def test_handle_segment_adds_to_existing_group(
@@ -125,8 +125,7 @@ class TestWeatherDataHandlerHandleSegment:
         await handler.handle_segment(second_segment)
 
         file_key = sample_segment.key
-        assert len(handler.file_segments[file_key]) == 2
-        assert second_segment in handler.file_segments[file_key]
+        assert handler.file_segments[file_key] == [sample_segment, second_segment, None]
 
     @pytest.mark.asyncio
     async def test_handle_segment_logs_debug_info(
@@ -176,6 +175,65 @@ class TestWeatherDataHandlerHandleSegment:
             await handler.handle_segment(segment2)
             mock_reconstruct.assert_called_once_with(segment1.key, [segment1, segment2])
 
+    @pytest.mark.asyncio
+    async def test_handle_segment_ignores_repeated_block(
+        self,
+        handler: WeatherDataHandler,
+        sample_segment: QBTSegment,
+    ) -> None:
+        """Test that a repeated block does not count towards file completion."""
+        with patch.object(handler, "_reconstruct_file", new_callable=AsyncMock) as mock_reconstruct:
+            for _ in range(sample_segment.total_blocks):
+                await handler.handle_segment(sample_segment)
+
+            mock_reconstruct.assert_not_called()
+
+        assert handler.file_segments[sample_segment.key] == [sample_segment, None, None]
+
+    @pytest.mark.asyncio
+    async def test_handle_segment_ignores_out_of_range_block(
+        self,
+        handler: WeatherDataHandler,
+        sample_segment: QBTSegment,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a block number beyond the file's block count is ignored."""
+        await handler.handle_segment(sample_segment)
+        out_of_range = QBTSegment(
+            filename=sample_segment.filename,
+            block_number=4,
+            total_blocks=3,
+            content=b"Stray block",
+            timestamp=sample_segment.timestamp,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            await handler.handle_segment(out_of_range)
+
+        assert handler.file_segments[sample_segment.key] == [sample_segment, None, None]
+        assert "Ignoring out of range block" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_handle_segment_ignores_excessive_block_count(
+        self,
+        handler: WeatherDataHandler,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a block count above MAX_TOTAL_BLOCKS is rejected before allocation."""
+        segment = QBTSegment(
+            filename="huge.txt",
+            block_number=1,
+            total_blocks=MAX_TOTAL_BLOCKS + 1,
+            content=b"Block 1",
+        )
+
+        with caplog.at_level(logging.WARNING):
+            await handler.handle_segment(segment)
+
+        assert segment.key not in handler.file_segments
+        assert segment.key not in handler._received_masks
+        assert "Ignoring invalid block count" in caplog.text
+
     @pytest.mark.asyncio
     async def test_handle_segment_concurrent_files(self, handler: WeatherDataHandler) -> None:
         """Test handling of multiple files concurrently."""
@@ -212,8 +270,8 @@ class TestWeatherDataHandlerHandleSegment:
 
         # Both files should have separate segment collections
         assert len(handler.file_segments) == 2
-        assert len(handler.file_segments[file1_seg1.key]) == 1
-        assert len(handler.file_segments[file2_seg1.key]) == 1
+        assert handler.file_segments[file1_seg1.key] == [file1_seg1, None]
+        assert handler.file_segments[file2_seg1.key] == [file2_seg1, None]
 
         with patch.object(handler, "_reconstruct_file", new_callable=AsyncMock) as mock_reconstruct:
             await handler.handle_segment(file1_seg2)
@@ -230,21 +288,21 @@ class TestWeatherDataHandlerReconstructFile:
 
     @pytest.fixture
     def sample_segments(self) -> list[QBTSegment]:
-        """Create sample segments for testing file reconstruction."""
+        """Create sample segments, stored in block order, for testing file reconstruction."""
         timestamp = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         return [
             QBTSegment(
                 filename="test_file.txt",
-                block_number=2,
+                block_number=1,
                 total_blocks=3,
-                content=b"Second block",
+                content=b"First block",
                 timestamp=timestamp,
             ),
             QBTSegment(
                 filename="test_file.txt",
-                block_number=1,
+                block_number=2,
                 total_blocks=3,
-                content=b"First block",
+                content=b"Second block",
                 timestamp=timestamp,
             ),
             QBTSegment(
@@ -257,12 +315,12 @@ class TestWeatherDataHandlerReconstructFile:
         ]
 
     @pytest.mark.asyncio
-    async def test_reconstruct_file_sorts_segments_by_block_number(
+    async def test_reconstruct_file_writes_segments_in_block_order(
         self,
         handler: WeatherDataHandler,
         sample_segments: list[QBTSegment],
     ) -> None:
-        """Test that segments are sorted by block number before reconstruction."""
+        """Test that segment content is written in block slot order."""
         file_key = sample_segments[0].key
         handler.file_segments[file_key] = sample_segments.copy()
 
@@ -298,6 +356,36 @@ class TestWeatherDataHandlerReconstructFile:
         assert output_path.exists()
         assert output_path.read_bytes() == b"Test content"
 
+    @pytest.mark.asyncio
+    async def test_reconstruct_file_creates_each_parent_directory_once(
+        self,
+        handler: WeatherDataHandler,
+    ) -> None:
+        """Test that an already ensured parent directory is not created again."""
+        timestamp = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+        segments = [
+            QBTSegment(
+                filename=f"subdir/file{i}.txt",
+                block_number=1,
+                total_blocks=1,
+                content=b"Test content",
+                timestamp=timestamp,
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            for segment in segments:
+                await handler.handle_segment(segment)
+
+        mock_mkdir.assert_called_once_with(
+            handler.output_dir / "subdir",
+            parents=True,
+            exist_ok=True,
+        )
+        for i in range(3):
+            assert (handler.output_dir / "subdir" / f"file{i}.txt").exists()
+
     @pytest.mark.asyncio
     async def test_reconstruct_file_logs_success(
         self,
@@ -329,7 +417,7 @@ class TestWeatherDataHandlerReconstructFile:
         handler.file_segments[file_key] = sample_segments.copy()
 
         with (
-            patch.object(Path, "write_bytes", side_effect=OSError("Permission denied")),
+            patch.object(Path, "open", side_effect=OSError("Permission denied")),
             caplog.at_level(logging.ERROR),
         ):
             await handler._reconstruct_file(file_key, sample_segments)
@@ -364,11 +452,31 @@ class TestWeatherDataHandlerReconstructFile:
         file_key = sample_segments[0].key
         handler.file_segments[file_key] = sample_segments.copy()
 
-        with patch.object(Path, "write_bytes", side_effect=OSError("Permission denied")):
+        with patch.object(Path, "open", side_effect=OSError("Permission denied")):
             await handler._reconstruct_file(file_key, sample_segments)
 
         assert file_key not in handler.file_segments
 
+    @pytest.mark.asyncio
+    async def test_reconstruct_file_releases_segments_before_writing(
+        self,
+        handler: WeatherDataHandler,
+        sample_segments: list[QBTSegment],
+    ) -> None:
+        """Test that segments are released before the threaded write starts."""
+        file_key = sample_segments[0].key
+        handler.file_segments[file_key] = sample_segments.copy()
+        pending_during_write: list[bool] = []
+
+        def record_pending(_output_path: Path, _segments: list[QBTSegment]) -> int:
+            pending_during_write.append(file_key in handler.file_segments)
+            return 0
+
+        with patch.object(handler, "_write_segments", side_effect=record_pending):
+            await handler._reconstruct_file(file_key, sample_segments)
+
+        assert pending_during_write == [False]
+
     @pytest.mark.asyncio
     async def test_reconstruct_file_empty_content(self, handler: WeatherDataHandler) -> None:
         """Test reconstruction of file with empty content."""
@@ -560,7 +668,7 @@ class TestWeatherDataHandlerIntegration:
         # Verify segment is stored in memory
         file_key = segment1.key
         assert file_key in handler.file_segments
-        assert len(handler.file_segments[file_key]) == 1
+        assert handler.file_segments[file_key] == [segment1, None, None]
 
         # Verify no file was written yet
         output_path = handler.output_dir / "incomplete_file.txt"
@@ -719,17 +827,18 @@ class TestWeatherDataHandlerEdgeCases:
 #    - Custom output directory handling
 #    - Filesystem directory creation
 #
-# 2. **Segment Handling** (6 tests):
+# 2. **Segment Handling** (8 tests):
 #    - FILLFILE.TXT filtering (filler data exclusion)
 #    - Segment grouping by unique file key
 #    - Adding segments to existing groups
 #    - Debug logging verification
 #    - File reconstruction triggering when complete
+#    - Repeated and out of range blocks ignored
 #    - Concurrent multi-file processing
 #
-# 3. **File Reconstruction** (7 tests):
-#    - Segment sorting by block number
-#    - Parent directory creation
+# 3. **File Reconstruction** (8 tests):
+#    - Joining segments in block order
+#    - Parent directory creation (once per directory)
 #    - Success logging
 #    - Error handling for file system failures
 #    - Memory cleanup after successful reconstruction
@@ -749,7 +858,7 @@ class TestWeatherDataHandlerEdgeCases:
 #    - Zero-length content blocks
 #    - Mixed content with empty blocks
 #
-# Total: 25 test cases covering:
+# Total: 29 test cases covering:
 # - All public methods (__init__, handle_segment)
 # - Private method behavior (_reconstruct_file)
 # - Error conditions and recovery
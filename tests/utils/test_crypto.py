@@ -19,6 +19,13 @@ def test_xor_encode_and_decode_bytes():
     assert crypto.xor_decode(original) == crypto.xor_encode(original)
 
 
+def test_xor_decode_matches_bytewise_xor_for_all_values():
+    data = bytearray(range(256))
+    decoded = crypto.xor_decode(data)
+    assert type(decoded) is bytes
+    assert decoded == bytes(b ^ 0xFF for b in data)
+
+
 @pytest.mark.parametrize(
     ("text", "encoding"),
     [
@@ -145,3 +152,26 @@ def test_xorbuffer_peek_offset_and_bounds():
     assert buf.peek(100, offset=6) == b"gh"
     # Offset past end
     assert buf.peek(2, offset=100) == b""
+
+
+def test_xorbuffer_find_searches_decoded_content():
+    buf = crypto.XorBuffer(crypto.xor_encode(b"xxabc\x00\x00abc"))
+    assert buf.find(b"abc") == 2
+    assert buf.find(b"abc", offset=3) == 7
+    assert buf.find(b"\x00\x00") == 5
+    assert buf.find(b"zzz") == -1
+
+    # Offsets are relative to the current read position
+    _ = buf.read(3)
+    assert buf.find(b"abc") == 4
+
+
+def test_xorbuffer_skip_leading_stops_at_first_other_byte():
+    buf = crypto.XorBuffer(crypto.xor_encode(b"\x00\x00\x00ab\x00"))
+    assert buf.skip_leading(b"\x00") == 3
+    assert buf.peek(2) == b"ab"
+    assert buf.skip_leading(b"\x00") == 0
+
+    buf.skip(2)
+    assert buf.skip_leading(b"\x00") == 1
+    assert buf.available() == 0
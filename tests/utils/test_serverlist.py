@@ -91,6 +91,12 @@ def test_get_next_server_cycles(temp_persist_path: Path) -> None:
     assert seen[4] == servers[1]
 
 
+def test_get_next_server_includes_sat_servers_after_save(temp_persist_path: Path) -> None:
+    mgr = ServerListManager(persist_path=temp_persist_path, shuffle_on_load=False)
+    mgr.save_server_list(make_server_list(servers=[("a", 1)], sat_servers=[("sat", 2)]))
+    assert [mgr.get_next_server() for _ in range(3)] == [("a", 1), ("sat", 2), ("a", 1)]
+
+
 def test_reset_index(temp_persist_path: Path) -> None:
     servers = [("a", 1), ("b", 2)]
     mgr = ServerListManager(persist_path=temp_persist_path, enable_persistence=True)